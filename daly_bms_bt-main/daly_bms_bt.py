@@ -7,9 +7,9 @@ import argparse
 import asyncio
 import os
 import signal
+from concurrent.futures import ThreadPoolExecutor
 from modules import DalyBMSBluetooth
 from modules import get_logger
-from modules.db import PostgresDB
 import datetime
 
 
@@ -60,21 +60,86 @@ DB_CONFIG = {
     "password": os.getenv("DB_PASSWORD", "odoo"),
 }
 TABLE_NAME = "bms_data"
+# Samples are buffered and written in one statement once either limit is hit
+BATCH_SIZE = int(os.getenv("DB_BATCH_SIZE", 50))
+FLUSH_INTERVAL = int(os.getenv("DB_FLUSH_INTERVAL", 60))
+# Batches at least this large are bulk loaded with COPY instead of INSERT
+COPY_THRESHOLD = int(os.getenv("DB_COPY_THRESHOLD", 500))
+# Samples waiting for the DB writer; the oldest are dropped once it's full
+DB_QUEUE_SIZE = int(os.getenv("DB_QUEUE_SIZE", 1000))
+# Writer tasks draining the queue, each flushing on its own pooled connection and db thread
+DB_WRITERS = int(os.getenv("DB_WRITERS", 2))
+# Upper bound in seconds for the BLE reconnect back-off
+MAX_BACKOFF = int(os.getenv("BT_MAX_BACKOFF", 60))
+
+
+async def write_rows(db, rows, executor):
+    if len(rows) >= COPY_THRESHOLD:
+        write = db.copy_bms_rows
+    else:
+        write = db.insert_bms_rows_batch
+    await asyncio.get_running_loop().run_in_executor(executor, write, TABLE_NAME, rows)
+
+
+async def db_writer(db, queue, executor):
+    """
+    Drain queued samples into the DB so BLE polling never waits on it. A batch is
+    written once BATCH_SIZE rows are collected or FLUSH_INTERVAL seconds after its
+    first row arrived. Several writers may share one queue, so each can have a
+    batch in flight at the same time.
+
+    Writers stop only on a None taken from the queue: the batch collected so far
+    is written first. Post one None per writer, after the last sample, so every
+    sample ahead of the markers is written before the writers return.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        row = await queue.get()
+        if row is None:
+            return
+        rows = [row]
+        stop = False
+        deadline = loop.time() + FLUSH_INTERVAL
+        while len(rows) < BATCH_SIZE:
+            try:
+                row = await asyncio.wait_for(queue.get(), deadline - loop.time())
+            except asyncio.TimeoutError:
+                break
+            if row is None:
+                stop = True
+                break
+            rows.append(row)
+        await write_rows(db, rows, executor)
+        if stop:
+            return
+
+
+async def stop_writers(queue, writer_tasks):
+    # One None per writer, queued behind every sample, tells each to flush and stop
+    for _ in writer_tasks:
+        await queue.put(None)
+    await asyncio.gather(*writer_tasks, return_exceptions=True)
 
 
 class DalyBMSConnection:
-    def __init__(self, mac_address, logger, adapter="hci0", db=None):
+    __slots__ = ("logger", "adapter", "mac_address", "queue", "last_data_received", "bt_bms")
+
+    def __init__(self, mac_address, logger, adapter="hci0", queue=None):
         self.logger = logger
         self.adapter = adapter
         self.mac_address = mac_address
-        self.db = db
+        self.queue = queue
         self.last_data_received = None
         self.bt_bms = DalyBMSBluetooth(self.mac_address, self.logger, self.adapter)
 
     async def connect(self):
-        if not self.bt_bms.client.is_connected:
+        if not self.bt_bms.is_connected:
             await self.bt_bms.connect()
 
+    async def reset(self):
+        # Reuse this object across reconnects
+        await self.bt_bms.reset()
+
     async def disconnect(self):
         try:
             await self.bt_bms.disconnect()
@@ -82,60 +147,87 @@ class DalyBMSConnection:
             self.logger.debug(f"Disconnect error (ignored): {e}")
 
     async def get_full_data_and_save(self):
-        # Gather both SOC and CellVoltages, then save to DB in one call
-        soc_data = await self.bt_bms.get_soc()
-        cell_voltages_data = await self.bt_bms.get_cell_voltages()
-        self.logger.debug({"SOC": soc_data, "CellVoltages": cell_voltages_data})
+        # Request SOC and CellVoltages concurrently, then save to DB in one call.
+        # Responses are matched to requests by command byte, so they can overlap.
+        soc_data, cell_voltages_data = await asyncio.gather(
+            self.bt_bms.get_soc(),
+            self.bt_bms.get_cell_voltages(),
+            return_exceptions=True,
+        )
+        for result in (soc_data, cell_voltages_data):
+            if isinstance(result, Exception):
+                raise result
         if not soc_data or not cell_voltages_data:
             self.logger.warning("Missing data: SOC or CellVoltages not received")
             return
-        # Prepare cell voltages as list, handling variable number of cells
-        cell_voltages = [
-            cell_voltages_data[k] for k in sorted(cell_voltages_data.keys())
-        ]
-
-        # Print SOC data first, then cell voltages on next line
-        print(soc_data)
-        print(cell_voltages)
-        point = [
-            "BMS",
-            self.mac_address,
-            time.time(),
-            {"soc": soc_data, "cell_voltages": cell_voltages},
-        ]
-        self.last_data_received = time.time()
-
-        # --- Save to DB ---
-        if self.db is not None:
+        # Place each voltage at its cell index (1-based) in a list sized to the
+        # BMS cell count; cells that didn't report keep 0.0 instead of shifting
+        cell_voltages = [0.0] * self.bt_bms.status["cells"]
+        for cell, voltage in cell_voltages_data.items():
+            cell_voltages[cell - 1] = voltage
+
+        # Read the clocks once per sample and derive everything else from them
+        now = time.time()
+        self.last_data_received = asyncio.get_running_loop().time()
+
+        # Lazy %-formatting: nothing is rendered unless DEBUG is enabled
+        self.logger.debug("soc=%s cells=%s", soc_data, cell_voltages)
+        row = (
             # Use UTC for database storage.
-            utc_now = datetime.datetime.now(datetime.timezone.utc)
-            loop = asyncio.get_running_loop()
-            await loop.run_in_executor(
-                None,
-                self.db.insert_bms_data_safe,
-                TABLE_NAME,
-                utc_now,
-                soc_data.get("total_voltage"),
-                soc_data.get("current"),
-                soc_data.get("soc_percent"),
-                cell_voltages,
-            )
-        return point
+            datetime.datetime.fromtimestamp(now, tz=datetime.timezone.utc),
+            soc_data.total_voltage,
+            soc_data.current,
+            soc_data.soc_percent,
+            cell_voltages,
+        )
+        # --- Hand off to the DB writer ---
+        if self.queue is not None:
+            self._enqueue(row)
+        return row
+
+    def _enqueue(self, row):
+        try:
+            self.queue.put_nowait(row)
+        except asyncio.QueueFull:
+            # DB is falling behind: keep the newest samples
+            self.queue.get_nowait()
+            self.queue.put_nowait(row)
+            self.logger.warning("DB queue full, dropped the oldest sample")
 
 
 async def main_loop(args, logger):
+    # loop.time() is the monotonic clock last_data_received is recorded with
+    mono = asyncio.get_running_loop().time
     db = None
+    db_executor = None
     con = None
+    writer_tasks = []
     try:
         # --- Setup DB ---
         if not args.no_db:
+            # Blocking psycopg2 calls run on their own threads, never on the event loop
+            # or in the default executor other libraries share
+            db_executor = ThreadPoolExecutor(max_workers=DB_WRITERS, thread_name_prefix="db")
+            loop = asyncio.get_running_loop()
             try:
+                # Imported here so --no-db runs never load psycopg2/libpq
+                from modules.db import PostgresDB
                 db = PostgresDB(**DB_CONFIG, logger=logger)
-                db.connect()
-                db.create_table(PostgresDB.get_create_bms_table_sql(TABLE_NAME))
+                await loop.run_in_executor(db_executor, db.connect)
+                await loop.run_in_executor(
+                    db_executor, db.create_table, PostgresDB.get_create_bms_table_sql(TABLE_NAME)
+                )
             except Exception as e:
                 logger.error(f"Database setup failed: {e}")
                 db = None
+        queue = None
+        if db is not None:
+            queue = asyncio.Queue(maxsize=DB_QUEUE_SIZE)
+            # No more writers than pooled connections, so none of them waits on getconn
+            writer_tasks = [
+                asyncio.create_task(db_writer(db, queue, db_executor))
+                for _ in range(max(1, min(DB_WRITERS, db.maxconn)))
+            ]
 
         if args.bt:
             mac_address = args.bt
@@ -143,43 +235,44 @@ async def main_loop(args, logger):
             logger.error("No BT MAC address provided.")
             return
 
-        con = DalyBMSConnection(mac_address, logger, args.hci, db=db)
+        con = DalyBMSConnection(mac_address, logger, args.hci, queue=queue)
         received_data = False
 
         if args.loop:
             logger.debug("Starting loop")
         else:
             logger.debug("Starting oneshot")
+        # Polls are scheduled against fixed deadlines so BLE/DB time doesn't add to the period
+        next_deadline = mono()
+        # Reconnect delay in seconds, doubled per failed connect and reset once data comes in
+        backoff = 1
 
         while args.loop or not received_data:
             try:
                 await con.connect()
             except Exception as e:
-                logger.warning(f"Connection failed: {e}. Retrying in 5s...")
-                try:
-                    await con.disconnect()
-                except:
-                    pass
-                # Recreate connection object to ensure fresh state
-                con = DalyBMSConnection(mac_address, logger, args.hci, db=db)
-                await asyncio.sleep(5)
+                logger.warning(f"Connection failed: {e}. Retrying in {backoff}s...")
+                # Tear down the BLE state but keep the connection object
+                await con.reset()
+                await asyncio.sleep(backoff)
+                backoff = min(MAX_BACKOFF, backoff * 2)
                 continue
 
-            if con.bt_bms.client.is_connected:
+            if con.bt_bms.is_connected:
                 try:
                     await con.get_full_data_and_save()
-                    print()
                     if con.last_data_received is None:
                         logger.warning("Failed receive data")
                         await asyncio.sleep(10)
                         continue
-                    time_diff = time.time() - con.last_data_received
+                    time_diff = mono() - con.last_data_received
                     if time_diff > 30:
                         logger.error(
                             "BMS thread didn't receive data for %0.1f seconds"
                             % time_diff
                         )
                     else:
+                        backoff = 1
                         if not received_data:
                             logger.info("First received data")
                             received_data = True
@@ -197,7 +290,12 @@ async def main_loop(args, logger):
                 await con.disconnect()
 
             if args.loop:
-                await asyncio.sleep(args.loop)
+                next_deadline += args.loop
+                now = mono()
+                if now - next_deadline > 2 * args.loop:
+                    # Far behind (e.g. after a reconnect): start over instead of catching up
+                    next_deadline = now
+                await asyncio.sleep(max(0, next_deadline - now))
             else:
                 await asyncio.sleep(1)
     finally:
@@ -206,8 +304,19 @@ async def main_loop(args, logger):
                 await con.disconnect()
             except Exception as e:
                 logger.error(f"Error disconnecting BT: {e}")
+        if writer_tasks:
+            # Batches may still be running in db_executor: wait for the writers before
+            # the pool is closed, even if this task is cancelled meanwhile
+            stopping = asyncio.ensure_future(stop_writers(queue, writer_tasks))
+            while not stopping.done():
+                try:
+                    await asyncio.shield(stopping)
+                except asyncio.CancelledError:
+                    pass
         if db:
             db.close()
+        if db_executor:
+            db_executor.shutdown(wait=False)
 
     if args.loop:
         logger.info("Loop ended")
@@ -224,6 +333,13 @@ def main_entry():
     signal.signal(signal.SIGTERM, signal_handler)
     # SIGINT is handled by KeyboardInterrupt automatically
 
+    # uvloop is optional; fall back to the stdlib selector loop when it is not installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     time.sleep(1)
     while True:
         try:
@@ -1,5 +1,5 @@
 from .daly_bms_bluetooth import DalyBMSBluetooth
-from .daly_bms import DalyBMS
+from .daly_bms import DalyBMS, SocSample
 from .logger import get_logger
 from .error_codes import ERROR_CODES
 ## No need to import Logger class; use get_logger from logger.py
@@ -2,9 +2,9 @@
 import serial
 import struct
 import time
-import math
 import logging
-import array
+from collections import namedtuple
+from .logger import exact_level
 
 # Logging configuration: all logs to daly_bms.log, warnings to daly_bms.warning.log, errors to daly_bms.error.log
 import os
@@ -15,39 +15,61 @@ main_log_file = os.path.join(log_dir, 'daly_bms.log')
 warning_log_file = os.path.join(log_dir, 'daly_bms.warning.log')
 error_log_file = os.path.join(log_dir, 'daly_bms.error.log')
 
-class LevelFilter(logging.Filter):
-    def __init__(self, level):
-        super().__init__()
-        self.level = level
-    def filter(self, record):
-        return record.levelno == self.level
+_logger = None
 
 def setup_logging():
+    # Configure once; every DalyBMS without its own logger shares these handlers
+    global _logger
+    if _logger is not None:
+        return _logger
     logger = logging.getLogger("daly_bms")
     logger.setLevel(logging.DEBUG)
+    formatter = logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s')
+    # delay=True: files are only opened once something is written to them
     # Main log file (all logs)
-    fh_all = logging.FileHandler(main_log_file, mode='a')
+    fh_all = logging.FileHandler(main_log_file, mode='a', delay=True)
     fh_all.setLevel(logging.DEBUG)
-    fh_all.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+    fh_all.setFormatter(formatter)
     logger.addHandler(fh_all)
     # Warnings only
-    fh_warn = logging.FileHandler(warning_log_file, mode='a')
+    fh_warn = logging.FileHandler(warning_log_file, mode='a', delay=True)
     fh_warn.setLevel(logging.WARNING)
-    fh_warn.addFilter(LevelFilter(logging.WARNING))
-    fh_warn.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+    fh_warn.addFilter(exact_level(logging.WARNING))
+    fh_warn.setFormatter(formatter)
     logger.addHandler(fh_warn)
     # Errors only
-    fh_err = logging.FileHandler(error_log_file, mode='a')
+    fh_err = logging.FileHandler(error_log_file, mode='a', delay=True)
     fh_err.setLevel(logging.ERROR)
-    fh_err.addFilter(LevelFilter(logging.ERROR))
-    fh_err.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+    fh_err.addFilter(exact_level(logging.ERROR))
+    fh_err.setFormatter(formatter)
     logger.addHandler(fh_err)
     # Avoid duplicate logs if root logger is used elsewhere
     logger.propagate = False
+    _logger = logger
     return logger
 
 from .error_codes import ERROR_CODES
 
+# Response payload layouts, compiled once so the format isn't re-parsed on every unpack
+SOC_FRAME = struct.Struct(">h h h h")
+CELL_VOLTAGE_RANGE_FRAME = struct.Struct(">h b h b 2x")
+TEMPERATURE_RANGE_FRAME = struct.Struct(">b b b b 4x")
+MOSFET_STATUS_FRAME = struct.Struct(">b ? ? B l")
+STATUS_FRAME = struct.Struct(">b b ? ? b h x")
+# Cell voltage frame payload: frame_id, 3 cell voltages in mV, trailing byte
+CELL_FRAME = struct.Struct(">b 3h b")
+# Whole 13-byte cell voltage packet: A5, address, command, length, CELL_FRAME payload, checksum
+CELL_PACKET = struct.Struct(">4B b 3h b B")
+# Temperature frame payload: frame_id, 7 sensor temperatures
+TEMPERATURE_FRAME = struct.Struct("8b")
+FOUR_SHORTS_FRAME = struct.Struct(">4h")
+ALARMS_DIFF_TEMP_VOLT_FRAME = struct.Struct(">hhbbxx")
+RATED_NOMINALS_FRAME = struct.Struct(">ixxh")
+TWO_SHORTS_FRAME = struct.Struct(">hhxxxx")
+
+# Parsed SOC response; current is negative while charging, positive while discharging
+SocSample = namedtuple("SocSample", "total_voltage current soc_percent")
+
 class DalyBMS:
     def __init__(self, request_retries=3, address=4, logger=None):
         """
@@ -63,6 +85,10 @@ class DalyBMS:
             self.logger = setup_logging()
         self.request_retries = request_retries
         self.address = address  # 4 = USB, 8 = Bluetooth
+        # (command, extra) -> request message; the address is fixed per instance
+        self._cmd_bytes = {}
+        # Set when a reply was short or corrupt, so stale bytes get flushed before the next request
+        self._needs_flush = True
 
     def connect(self, device):
         """
@@ -95,9 +121,9 @@ class DalyBMS:
         Calculate the checksum of a message
 
         :param message_bytes: Bytes for which the checksum should get calculated
-        :return: Checksum as bytes
+        :return: Checksum as int (0-255), comparable directly with a frame's last byte
         """
-        return bytes([sum(message_bytes) & 0xFF])
+        return sum(message_bytes) & 0xFF
 
     def _format_message(self, command, extra=""):
         """
@@ -106,76 +132,117 @@ class DalyBMS:
         :param command: Command ID ("90" - "98")
         :return: Request message as bytes
         """
-        # 95 -> a58095080000000000000000c2
-        message = "a5%i0%s08%s" % (self.address, command, extra)
-        message = message.ljust(24, "0")
-        message_bytes = bytearray.fromhex(message)
-        message_bytes += self._calc_crc(message_bytes)
-        self.logger.debug("w %s" % message_bytes.hex())
+        message_bytes = self._cmd_bytes.get((command, extra))
+        if message_bytes is None:
+            # 95 -> a58095080000000000000000c2
+            message = "a5%i0%s08%s" % (self.address, command, extra)
+            message = message.ljust(24, "0")
+            message_bytes = bytearray.fromhex(message)
+            message_bytes.append(self._calc_crc(message_bytes))
+            message_bytes = self._cmd_bytes[(command, extra)] = bytes(message_bytes)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("w %s", message_bytes.hex())
         return message_bytes
 
-    def _read_request(self, command, extra="", max_responses=1, return_list=False):
+    def _read_request(self, command, extra="", max_responses=1):
         """
         Sends a read request to the BMS and reads the response. In case it fails, it retries 'max_responses' times.
 
         :param command: Command ID ("90" - "98"), "62", "63"
         :param max_responses: For how many response packages it should wait (Default: 1).
-        :return: Request message as bytes or False
+        :return: List of response payloads (empty if nothing valid arrived)
         """
         # This is a sync implementation for serial/RS485
-        self.logger.debug(f"Sending command {command} with max responses {max_responses}")
-        return self._read(command, extra=extra, max_responses=max_responses, return_list=return_list)
+        self.logger.debug("Sending command %s with max responses %s", command, max_responses)
+        return self._read(command, extra=extra, max_responses=max_responses)
+
+    def _read(self, command, extra="", max_responses=1):
+        self.logger.debug("-- %s ------------------------", command)
+        message_bytes = self._format_message(command, extra=extra)
+        buf = self._transfer(message_bytes, max_responses, command)
+        if buf is None:
+            return []
+        payloads = self._split_payloads(buf)
+        response_data = payloads.pop(int(command, 16), [])
+        if payloads:
+            # todo: verify  more header fields
+            self.logger.debug("invalid header: frames for commands %s while reading %s",
+                              ", ".join("%02x" % c for c in payloads), command)
+            self._needs_flush = True
+        return response_data
+
+    def _transfer(self, message_bytes, max_responses, command):
+        """
+        Write one or more request messages and read back the reply frames
 
-    def _read(self, command, extra="", max_responses=1, return_list=False):
-        self.logger.debug("-- %s ------------------------" % command)
+        :param message_bytes: Request message(s) to write in one go
+        :param max_responses: Total number of 13-byte frames expected in reply
+        :param command: Command ID(s) for log messages
+        :return: Raw reply bytes or None if the port couldn't be opened or written
+        """
         try:
-            if not self.serial.isOpen():
+            if not self.serial.is_open:
                 self.serial.open()
         except Exception as e:
             self.logger.error(f"Failed to open serial port: {e}")
-            return False
+            return None
         try:
-            message_bytes = self._format_message(command, extra=extra)
-            # clear all buffers, in case something is left from a previous command that failed
-            self.serial.reset_input_buffer()
-            self.serial.reset_output_buffer()
+            if self._needs_flush:
+                # clear all buffers, in case something is left from a previous command that failed
+                self.serial.reset_input_buffer()
+                self.serial.reset_output_buffer()
+                self._needs_flush = False
             if not self.serial.write(message_bytes):
                 self.logger.error(f"serial write failed for command {command}")
-                return False
+                self._needs_flush = True
+                return None
         except Exception as e:
             self.logger.error(f"Serial write/setup failed: {e}")
-            return False
-        x = 0
-        response_data = []
-        while True:
-            try:
-                b = self.serial.read(13)
-                if len(b) == 0:
-                    self.logger.debug("%i empty response for command %s" % (x, command))
+            self._needs_flush = True
+            return None
+        # Fetch all expected frames in as few reads as possible; each read returns
+        # early only on timeout, and the overall wait is still one timeout per frame
+        expected = 13 * max_responses
+        deadline = time.monotonic() + self.serial.timeout * max_responses
+        buf = b""
+        try:
+            while len(buf) < expected:
+                chunk = self.serial.read(expected - len(buf))
+                if not chunk:
+                    self.logger.debug("%i empty response for command %s", len(buf) // 13, command)
                     break
-                self.logger.debug("%i %s %s" % (x, b.hex(), len(b)))
-                x += 1
-                response_crc = self._calc_crc(b[:-1])
-                if response_crc != b[-1:]:
-                    self.logger.debug("response crc mismatch: %s != %s" % (response_crc.hex(), b[-1:].hex()))
-                header = b[0:4].hex()
-                # todo: verify  more header fields
-                if header[4:6] != command:
-                    self.logger.debug("invalid header %s: wrong command (%s != %s)" % (header, header[4:6], command))
-                    continue
-                data = b[4:-1]
-                response_data.append(data)
-                if x == max_responses:
+                buf += chunk
+                if time.monotonic() >= deadline:
                     break
-            except Exception as e:
-                self.logger.error(f"Error during serial read: {e}")
-                break
-        if return_list or len(response_data) > 1:
-            return response_data
-        elif len(response_data) == 1:
-            return response_data[0]
-        else:
-            return False
+        except Exception as e:
+            self.logger.error(f"Error during serial read: {e}")
+        if len(buf) != expected:
+            # The rest may still arrive and would be mistaken for the next reply
+            self._needs_flush = True
+        if len(buf) % 13:
+            self.logger.debug("dropping %i trailing bytes for command %s", len(buf) % 13, command)
+        return buf
+
+    def _split_payloads(self, buf):
+        """
+        Split a reply stream into 13-byte frames and group their payloads by command byte
+
+        :return: Dict of command byte (int) to list of 8-byte payloads, in arrival order
+        """
+        # Validate frames through views of the buffer; only accepted payloads get copied
+        view = memoryview(buf)
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        payloads = {}
+        for start in range(0, len(buf) - 12, 13):
+            frame = view[start:start + 13]
+            if debug:
+                self.logger.debug("%i %s %s", start // 13, frame.hex(), len(frame))
+            response_crc = self._calc_crc(frame[:12])
+            if response_crc != frame[12]:
+                self.logger.debug("response crc mismatch: %02x != %02x", response_crc, frame[12])
+                self._needs_flush = True
+            payloads.setdefault(frame[2], []).append(bytes(frame[4:12]))
+        return payloads
 
     def _calc_num_responses(self, status_field, num_per_frame):
         if not self.status:
@@ -194,24 +261,28 @@ class DalyBMS:
 #                return False
 #        else:
             # via UART/USB the BMS returns only frames that have data
-        return math.ceil(self.status[status_field] / num_per_frame)
+        return -(-self.status[status_field] // num_per_frame)
 
-    def _split_frames(self, response_data, status_field, structure):
-        values = {}
+    def _split_frames(self, response_data, status_field, frame):
+        """
+        Collect the values of a multi-frame response in frame order
+
+        :param response_data: List of frame payloads
+        :param frame: struct.Struct of one payload: frame number followed by its values
+        :return: Dict of value number (1-based) to value
+        """
+        count = self.status[status_field]
+        values = []
         x = 1
-        for response_bytes in response_data:
-            if response_bytes == x:
-                parts = struct.unpack(structure, response_data)
-            else:
-                parts = struct.unpack(structure, response_bytes)
+        for parts in frame.iter_unpack(b"".join(response_data)):
             if parts[0] != x:
-                self.logger.warning("frame out of order, expected %i, got %i" % (x, response_bytes[0]))
+                self.logger.warning("frame out of order, expected %i, got %i", x, parts[0])
                 continue
-            for value in parts[1:]:
-                values[len(values) + 1] = value
-                if len(values) == self.status[status_field]:
-                    return values
+            values.extend(parts[1:])
+            if len(values) >= count:
+                break
             x += 1
+        return dict(enumerate(values[:count], start=1))
 
     def get_soc(self, response_data=None):
         # SOC of Total Voltage Current
@@ -220,14 +291,13 @@ class DalyBMS:
         if not response_data:
             return False
         try:
-            parts = struct.unpack('>h h h h', response_data)
-            data = {
-                "total_voltage": parts[0] / 10,
-                # "x_voltage": parts[1] / 10, # always 0
-                "current": (parts[2] - 30000) / 10,  # negative=charging, positive=discharging
-                "soc_percent": parts[3] / 10
-            }
-            return data
+            parts = SOC_FRAME.unpack(response_data[0])
+            return SocSample(
+                total_voltage=parts[0] / 10,
+                # x_voltage = parts[1] / 10, always 0
+                current=(parts[2] - 30000) / 10,
+                soc_percent=parts[3] / 10,
+            )
         except Exception as e:
             self.logger.error(f"Failed to unpack SOC data: {e}")
             return False
@@ -239,7 +309,7 @@ class DalyBMS:
         if not response_data:
             return False
 
-        parts = struct.unpack('>h b h b 2x', response_data)
+        parts = CELL_VOLTAGE_RANGE_FRAME.unpack(response_data[0])
         data = {
             "highest_voltage": parts[0] / 1000,
             "highest_cell": parts[1],
@@ -254,7 +324,7 @@ class DalyBMS:
             response_data = self._read_request("92")
         if not response_data:
             return False
-        parts = struct.unpack('>b b b b 4x', response_data)
+        parts = TEMPERATURE_RANGE_FRAME.unpack(response_data[0])
         data = {
             "highest_temperature": parts[0] - 40,
             "highest_sensor": parts[1],
@@ -270,8 +340,9 @@ class DalyBMS:
         if not response_data:
             return False
         # todo: implement
-        self.logger.debug(response_data.hex())
-        parts = struct.unpack('>b ? ? B l', response_data)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(response_data[0].hex())
+        parts = MOSFET_STATUS_FRAME.unpack(response_data[0])
         if parts[0] == 0:
             mode = "stationary"
         elif parts[0] == 1:
@@ -294,16 +365,10 @@ class DalyBMS:
         if not response_data:
             return False
 
-        parts = struct.unpack('>b b ? ? b h x', response_data)
-        state_bits = bin(parts[4])[2:]
+        parts = STATUS_FRAME.unpack(response_data[0])
         state_names = ["DI1", "DI2", "DI3", "DI4", "DO1", "DO2", "DO3", "DO4"]
-        states = {}
-        state_index = 0
-        for bit in reversed(state_bits):
-            if len(state_bits) == state_index:
-                break
-            states[state_names[state_index]] = bool(int(bit))
-            state_index += 1
+        # bit 0 is DI1 ... bit 7 is DO4
+        states = {name: bool((parts[4] >> i) & 1) for i, name in enumerate(state_names)}
         data = {
             "cells": parts[0],  # number of cells
             "temperature_sensors": parts[1],  # number of sensors
@@ -324,62 +389,45 @@ class DalyBMS:
             if not max_responses:
                 self.logger.error("Failed to calculate number of responses for cell voltages")
                 return False
-            response_data = self._read_request("95", max_responses=max_responses, return_list=True)
+            response_data = self._read_request("95", max_responses=max_responses)
         if not response_data:
             self.logger.error("No response data for cell voltages")
             return False
+        cells = self.status["cells"]
         cell_voltages = {}
-        if isinstance(response_data, list):
-            for response in response_data:
-                self.logger.debug(f"Parsing response: {response.hex()}")
-                if len(response) == 200:
-                    # Split 200-byte response into 13-byte packets
-                    for i in range(0, len(response), 13):
-                        if i + 13 <= len(response) and response[i] == 0xA5 and response[i + 2] == 0x95:
-                            try:
-                                # Extract 8-byte payload (frame_id, 3 voltages, trailing byte)
-                                payload = response[i + 4:i + 12]  # Skip A5 01 95 08, take next 8 bytes
-                                if len(payload) != 8:
-                                    self.logger.error(f"Invalid payload length: {payload.hex()}")
-                                    continue
-                                parts = struct.unpack(">b 3h b", payload)
-                                frame_id = parts[0]
-                                if frame_id > self.status["cells"]:
-                                    continue  # Skip frames beyond number of cells
-                                for j, voltage in enumerate(parts[1:4], start=(frame_id - 1) * 3 + 1):
-                                    if voltage > 0 and j <= self.status["cells"]:
-                                        cell_voltages[j] = voltage / 1000.0
-                            except struct.error as e:
-                                self.logger.error(
-                                    f"Failed to unpack 13-byte chunk: {response[i:i + 13].hex()}, error: {e}")
-                        else:
-                            self.logger.debug(f"Skipping invalid chunk at offset {i}: {response[i:i + 13].hex()}")
-                elif len(response) == 8:
-                    try:
-                        parts = struct.unpack(">b 3h b", response)
-                        frame_id = parts[0]
-                        if frame_id > self.status["cells"]:
-                            continue
-                        for j, voltage in enumerate(parts[1:4], start=(frame_id - 1) * 3 + 1):
-                            if voltage > 0 and j <= self.status["cells"]:
-                                cell_voltages[j] = voltage / 1000.0
-                    except struct.error as e:
-                        self.logger.error(f"Failed to unpack 8-byte response: {response.hex()}, error: {e}")
-                elif len(response) == 13 and response[0] == 0xA5 and response[2] == 0x95:
-                    try:
-                        # Extract 8-byte payload from 13-byte response
-                        payload = response[4:12]
-                        parts = struct.unpack(">b 3h b", payload)
-                        frame_id = parts[0]
-                        if frame_id > self.status["cells"]:
-                            continue
-                        for j, voltage in enumerate(parts[1:4], start=(frame_id - 1) * 3 + 1):
-                            if voltage > 0 and j <= self.status["cells"]:
-                                cell_voltages[j] = voltage / 1000.0
-                    except struct.error as e:
-                        self.logger.error(f"Failed to unpack 13-byte response: {response.hex()}, error: {e}")
-                else:
-                    self.logger.error(f"Invalid response length: {len(response)} bytes, data: {response.hex()}")
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        for response in response_data:
+            if debug:
+                self.logger.debug("Parsing response: %s", response.hex())
+            # Collect the (frame_id, 3 voltages, trailing byte) payloads, whatever shape the response has
+            if len(response) == 200:
+                # Unpack all complete 13-byte packets in one iter_unpack pass; the tail is padding
+                packets = memoryview(response)[:len(response) - len(response) % CELL_PACKET.size]
+                frames = []
+                for i, packet in enumerate(CELL_PACKET.iter_unpack(packets)):
+                    offset = i * CELL_PACKET.size
+                    # Header alone would accept e.g. zero padding with a matching zero checksum, so check both
+                    if packet[0] == 0xA5 and packet[2] == 0x95 and self._calc_crc(packets[offset:offset + 12]) == packet[-1]:
+                        frames.append(packet[4:])
+                    elif debug:
+                        self.logger.debug("Skipping invalid chunk at offset %i: %s", offset, response[offset:offset + 13].hex())
+            elif len(response) == 8:
+                # Bare payload: the transport already checked the frame checksum
+                frames = (CELL_FRAME.unpack(response),)
+            elif (len(response) == 13 and response[0] == 0xA5 and response[2] == 0x95
+                  and self._calc_crc(response[:12]) == response[12]):
+                # Unpack the 8-byte payload in place from the 13-byte response
+                frames = (CELL_FRAME.unpack_from(response, 4),)
+            else:
+                self.logger.error(f"Invalid response: {len(response)} bytes, data: {response.hex()}")
+                continue
+            for frame in frames:
+                frame_id = frame[0]
+                if frame_id > cells:
+                    continue  # Skip frames beyond number of cells
+                for j, voltage in enumerate(frame[1:4], start=(frame_id - 1) * 3 + 1):
+                    if voltage > 0 and j <= cells:
+                        cell_voltages[j] = voltage / 1000.0
         if not cell_voltages:
             self.logger.error("No valid cell voltages parsed")
             return False
@@ -396,10 +444,10 @@ class DalyBMS:
             self.logger.error("Undefined pack or cell")
             return
         if not response_data:
-            response_data = self._read_request(cmd, max_responses=1, return_list=True)
+            response_data = self._read_request(cmd, max_responses=1)
         if not response_data:
             return False
-        parts=struct.unpack(">hhhh", response_data)
+        parts = FOUR_SHORTS_FRAME.unpack(response_data[0])
         data = {
             "alarm1_max_voltage": parts[0] / divider,
             "alarm2_max_voltage": parts[1] / divider,
@@ -414,14 +462,12 @@ class DalyBMS:
             max_responses = self._calc_num_responses(status_field="temperature_sensors", num_per_frame=7)
             if not max_responses:
                 return
-            response_data = self._read_request("96", max_responses=max_responses, return_list=True)
+            response_data = self._read_request("96", max_responses=max_responses)
         if not response_data:
             return False
         temperatures = self._split_frames(response_data=response_data, status_field="temperature_sensors",
-                                          structure="8b")
-        for id in temperatures:
-            temperatures[id] = temperatures[id] - 40
-        return temperatures
+                                          frame=TEMPERATURE_FRAME)
+        return {sensor: value - 40 for sensor, value in temperatures.items()}
 
     def get_balancing_status(self, response_data=None):
         # Cell balancing status
@@ -429,13 +475,12 @@ class DalyBMS:
             response_data = self._read_request("97")
         if not response_data:
             return False
-        self.logger.debug(response_data.hex())
-        bits = bin(int(response_data.hex(), base=16))[2:].zfill(48)
-        self.logger.debug(bits)
-        cells = {}
-        for cell in range(1, self.status["cells"] + 1):
-            cells[cell] = bool(int(bits[cell * -1]))
-        self.logger.info(cells)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(response_data[0].hex())
+        # bit 0 is cell 1
+        bits = int.from_bytes(response_data[0], byteorder='big')
+        cells = {cell: bool((bits >> (cell - 1)) & 1) for cell in range(1, self.status["cells"] + 1)}
+        self.logger.info("%s", cells)
         # todo: get sample data and verify result
         return cells
 
@@ -443,24 +488,19 @@ class DalyBMS:
         # Battery failure status
         if not response_data:
             response_data = self._read_request("98")
-        if int.from_bytes(response_data, byteorder='big') == 0:
+        if not response_data:
+            return False
+        error_bits = int.from_bytes(response_data[0], byteorder='big')
+        if error_bits == 0:
             return {"Error": "0"}
-        self.logger.debug("ErrorCode %s", response_data)
-        self.logger.debug("ErrorBits %s", bin(int(response_data.hex(), base=16))[2:].zfill(48))
-        byte_index = 0
+        self.logger.debug("ErrorCode %s", response_data[0])
         errors = []
-        for b in response_data:
-            if b == 0:
-                byte_index += 1
-                continue
-            bits = bin(b)[2:]
-            bit_index = 0
-            for bit in reversed(bits):
-                if bit == "1":
-                    errors.append(ERROR_CODES[byte_index][bit_index])
-                bit_index += 1
-            self.logger.debug("%s %s %s" % (byte_index, b, bits))
-            byte_index += 1
+        for byte_index, b in enumerate(response_data[0]):
+            # Visit only the set bits, lowest first
+            while b:
+                lowest = b & -b
+                errors.append(ERROR_CODES[byte_index][lowest.bit_length() - 1])
+                b ^= lowest
         return errors
 
     def get_hw_sw_version(self, response_data=None, hard_soft=None):
@@ -472,7 +512,7 @@ class DalyBMS:
             self.logger.error("Hardware/Software not selected for version query")
             return False
         if not response_data:
-            response_data = self._read_request(cmd, max_responses=2, return_list=True)
+            response_data = self._read_request(cmd, max_responses=2)
         if not response_data or not isinstance(response_data, list) or len(response_data) < 2:
             self.logger.error(f"Invalid response data for {hard_soft} version: {response_data}")
             return False
@@ -491,7 +531,7 @@ class DalyBMS:
             response_data = self._read_request("5e")
         if not response_data:
             return False
-        parts = struct.unpack('>hhbbxx', response_data)
+        parts = ALARMS_DIFF_TEMP_VOLT_FRAME.unpack(response_data[0])
         data = {
             "alarm1cellvoltdiff": parts[0] / 1000,
             "alarm2cellvoltdiff": parts[1] / 1000,
@@ -505,7 +545,7 @@ class DalyBMS:
             response_data = self._read_request("5b")
         if not response_data:
             return False
-        parts = struct.unpack('>4h', response_data)
+        parts = FOUR_SHORTS_FRAME.unpack(response_data[0])
         data = {
             "alarm1chargeamperage": (30000 - parts[0]) / 10,
             "alarm2chargeamperage": (30000 - parts[1]) / 10,
@@ -519,7 +559,7 @@ class DalyBMS:
             response_data = self._read_request("50")
         if not response_data:
             return False
-        parts = struct.unpack('>ixxh', response_data)
+        parts = RATED_NOMINALS_FRAME.unpack(response_data[0])
         data = {
             "nominalratedcapacity": parts[0] / 1000,
             "nominalcellvoltage": parts[1] / 1000,
@@ -531,7 +571,7 @@ class DalyBMS:
             response_data = self._read_request("5f")
         if not response_data:
             return False
-        parts = struct.unpack('>hhxxxx', response_data)
+        parts = TWO_SHORTS_FRAME.unpack(response_data[0])
         data = {
             "balancestartvoltage": parts[0] / 1000,
             "balanceacceptablediff": parts[1] / 1000,
@@ -543,7 +583,7 @@ class DalyBMS:
             response_data = self._read_request("60")
         if not response_data:
             return False
-        parts = struct.unpack('>hhxxxx', response_data)
+        parts = TWO_SHORTS_FRAME.unpack(response_data[0])
         data = {
             "shutdownvoltage": parts[0],
             "shutdownohms": parts[1] / 1000,
@@ -559,12 +599,47 @@ class DalyBMS:
             response_data = self._read_request("d9", extra=extra)
         if not response_data:
             return False
-        self.logger.info(response_data.hex())
+        self.logger.info("%s", response_data[0].hex())
         # on response
         # 0101000002006cbe
         # off response
         # 0001000002006c44
 
+    def get_all_pipelined(self):
+        """
+        Same result as get_all, but all requests are written in one burst and the
+        replies are read back as one stream and dispatched by command byte, so the
+        BMS turnaround is paid once instead of per command. Commands whose reply
+        didn't make it fall back to a regular request in their parser.
+        Serial only; DalyBMSBluetooth.get_all already overlaps its requests.
+        """
+        if not self.status and not self.get_status():
+            return False
+        requests = (
+            ("90", 1), ("91", 1), ("92", 1), ("93", 1), ("94", 1),
+            ("95", self._calc_num_responses(status_field="cells", num_per_frame=3)),
+            ("96", self._calc_num_responses(status_field="temperature_sensors", num_per_frame=7)),
+            ("97", 1), ("98", 1),
+        )
+        message_bytes = b"".join(self._format_message(command) for command, _ in requests)
+        buf = self._transfer(message_bytes, sum(frames for _, frames in requests), "all")
+        payloads = self._split_payloads(buf) if buf else {}
+
+        def reply(command):
+            return payloads.get(int(command, 16))
+
+        return {
+            "soc": self.get_soc(reply("90")),
+            "cell_voltage_range": self.get_cell_voltage_range(reply("91")),
+            "temperature_range": self.get_temperature_range(reply("92")),
+            "mosfet_status": self.get_mosfet_status(reply("93")),
+            "status": self.get_status(reply("94")),
+            "cell_voltages": self.get_cell_voltages(reply("95")),
+            "temperatures": self.get_temperatures(reply("96")),
+            "balancing_status": self.get_balancing_status(reply("97")),
+            "errors": self.get_errors(reply("98"))
+        }
+
     def get_all(self):
         return {
             "soc": self.get_soc(),
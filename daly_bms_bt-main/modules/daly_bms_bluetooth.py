@@ -1,4 +1,7 @@
 import asyncio
+import logging
+import os
+import time
 from bleak import BleakClient, BleakScanner
 from .daly_bms import DalyBMS
 from .logger import get_logger
@@ -13,6 +16,19 @@ UUID_SERVICE = "0000fff0-0000-1000-8000-00805f9b34fb"
 UUID_NOTIFY = "0000fff1-0000-1000-8000-00805f9b34fb"
 UUID_WRITE = "0000fff2-0000-1000-8000-00805f9b34fb"
 
+# BLE connection interval requested from BlueZ, in units of 1.25 ms (7.5-15 ms).
+# Every query is a write/notify round trip, so the interval bounds its latency
+CONN_MIN_INTERVAL = 6
+CONN_MAX_INTERVAL = 12
+_DEBUGFS_BLUETOOTH = "/sys/kernel/debug/bluetooth"
+
+# Seconds a status reply is reused before get_status() asks the BMS again
+STATUS_TTL = 5.0
+
+# Command IDs of the queries that take a selector argument
+_ALARM_VOLTAGE_COMMANDS = {"Cell": "59", "Pack": "5a"}
+_VERSION_COMMANDS = {"Hardware": "63", "Software": "62"}
+
 class DalyBMSBluetooth(DalyBMS):
     def __init__(self, mac_address, logger=None, adapter=None, request_retries=3):
         """
@@ -25,283 +41,473 @@ class DalyBMSBluetooth(DalyBMS):
         self.adapter = adapter
         self.request_retries = request_retries
         # adapter arg is deprecated in newer bleak, removed usage
-        self.client = BleakClient(mac_address)
+        self.client = self._new_client(mac_address)
+        # Connection state, kept in sync by connect()/disconnect() and bleak's disconnected callback
+        self._connected = False
+        # BLEDevice from the last successful scan, reused by connect() to skip rescanning
+        self._device = None
+        # Characteristic objects resolved once per connection (see _cache_characteristics)
+        self._write_char = None
+        self._write_response = True
+        # command byte (int) -> response slot, created on first use and reused by every later request (see _slot)
         self.response_cache = {}
         self.status = None
+        # monotonic time of the last status reply, and the status request in flight, if any
+        self._status_ts = 0.0
+        self._status_task = None
+        # Requests may be in flight concurrently, but writes to the characteristic go one at a time
+        self._write_lock = asyncio.Lock()
+        # Concurrent requests that find the link down share one reconnect instead of racing on the client
+        self._connect_lock = asyncio.Lock()
+        # Notification length -> splitter, so the callback does one lookup instead of a length if/elif chain
+        self._notification_handlers = {
+            13: self._split_single,
+            26: self._split_pair,
+            39: self._split_cell_packets,
+            200: self._split_cell_packets,
+        }
 
     async def connect(self, timeout=20.0, retries=3):
         """
         Connect to the Bluetooth device using BleakClient and start notifications.
+
+        On Linux the adapter's connection interval is lowered first (see
+        _tune_connection_interval); this needs root and debugfs and is skipped otherwise.
+        The same can be configured persistently for BlueZ with a
+        [ConnectionParameters] section (MinInterval=6, MaxInterval=12, Latency=0,
+        Timeout=400) in /var/lib/bluetooth/<adapter>/<device>/info.
         """
-        if not self.client or not self.client.is_connected:
-            for attempt in range(retries):
-                try:
+        async with self._connect_lock:
+            # Another request may have reconnected while this one waited for the lock
+            if not self._connected:
+                await self._connect(timeout, retries)
+
+    async def _connect(self, timeout, retries):
+        self._tune_connection_interval()
+        for attempt in range(retries):
+            try:
+                device = self._device
+                if device is None:
                     self.logger.info(f"Scanning for {self.mac_address} (Attempt {attempt + 1}/{retries})...")
                     device = await BleakScanner.find_device_by_address(self.mac_address, timeout=20.0)
-                    if not device:
-                        self.logger.warning(f"Device {self.mac_address} not found during scan")
-                        if attempt < retries - 1:
-                            await asyncio.sleep(5.0)
-                            continue
-                        else:
-                            raise RuntimeError(f"Device {self.mac_address} not found after {retries} scan attempts")
-
-                    self.logger.info(f"Connecting to {self.mac_address}...")
-                    # Re-initialize client with the found device object to ensure proper DBus path
-                    self.client = BleakClient(device)
-                    await self.client.connect(timeout=30.0)
-                    self.logger.info(f"Bluetooth connected to {self.mac_address}")
-                    
-                    # Small delay to stabilize connection
-                    await asyncio.sleep(1.0)
-
-                    # Start notifications on the UUID
-                    self.logger.debug(f"Starting notifications on {UUID_NOTIFY}...")
-                    await self.client.start_notify(UUID_NOTIFY, self._notification_callback)
-                    self.logger.info(f"Notifications started on {UUID_NOTIFY}")
-                    return
-                except Exception as e:
-                    import traceback
-                    self.logger.warning(f"Bluetooth connection attempt {attempt + 1} failed: {e}")
-                    self.logger.debug(traceback.format_exc())
-                    # Ensure we are disconnected before retrying
-                    try:
-                        if self.client:
-                            await self.client.disconnect()
-                    except:
-                        pass
-                    
+                if not device:
+                    self.logger.warning(f"Device {self.mac_address} not found during scan")
                     if attempt < retries - 1:
-                        await asyncio.sleep(2.0)
+                        await asyncio.sleep(5.0)
+                        continue
                     else:
-                        self.logger.error(f"Bluetooth connection failed after {retries} attempts")
-                        raise
+                        raise RuntimeError(f"Device {self.mac_address} not found after {retries} scan attempts")
+
+                self.logger.info(f"Connecting to {self.mac_address}...")
+                # Re-initialize client with the found device object to ensure proper DBus path
+                self.client = self._new_client(device)
+                await self.client.connect(timeout=30.0)
+                self._device = device
+                self.logger.info(f"Bluetooth connected to {self.mac_address}")
+                
+                # Small delay to stabilize connection
+                await asyncio.sleep(1.0)
+                await self._acquire_mtu()
+                notify_char = self._cache_characteristics()
+
+                # Start notifications on the UUID
+                self.logger.debug(f"Starting notifications on {UUID_NOTIFY}...")
+                await self.client.start_notify(notify_char, self._notification_callback)
+                self.logger.info(f"Notifications started on {UUID_NOTIFY}")
+                self._connected = True
+                return
+            except Exception as e:
+                self.logger.warning(f"Bluetooth connection attempt {attempt + 1} failed: {e}")
+                # The traceback is only formatted if a handler actually emits the record
+                self.logger.debug("Connect attempt traceback", exc_info=True)
+                # The cached device may be stale, scan again on the next attempt
+                self._device = None
+                # Ensure we are disconnected before retrying
+                try:
+                    if self.client:
+                        await self.client.disconnect()
+                except:
+                    pass
+                
+                if attempt < retries - 1:
+                    await asyncio.sleep(2.0)
+                else:
+                    self.logger.error(f"Bluetooth connection failed after {retries} attempts")
+                    raise
+
+
+    async def reset(self):
+        """
+        Drop the current connection and any pending requests, but keep the scanned
+        device and the cached BMS status so the next connect() skips the scan and
+        the status round-trip.
+        """
+        try:
+            await self.client.disconnect()
+        except Exception as e:
+            self.logger.debug(f"Disconnect during reset failed (ignored): {e}")
+        # Wake pending requests; with no result set they count as unanswered
+        for slot in self.response_cache.values():
+            if not slot["done"]:
+                slot["done"] = True
+                slot["event"].set()
+        self._write_char = None
+        self._connected = False
+        self.client = self._new_client(self._device or self.mac_address)
+
+    @property
+    def is_connected(self):
+        """Locally tracked connection state; unlike client.is_connected this doesn't query the BLE backend."""
+        return self._connected
+
+    def _new_client(self, device):
+        return BleakClient(device, disconnected_callback=self._on_disconnected)
+
+    def _on_disconnected(self, client):
+        # Ignore late callbacks from a client that has already been replaced
+        if client is self.client:
+            self._connected = False
+            self.logger.info("Bluetooth connection lost")
+
+    def _cache_characteristics(self):
+        """
+        Resolve the notify/write characteristics once per connection so requests
+        don't repeat the UUID lookup, and skip the write response when the BMS
+        supports write-without-response.
+
+        :return: The notify characteristic (or its UUID if it can't be resolved)
+        """
+        services = self.client.services
+        notify_char = services.get_characteristic(UUID_NOTIFY)
+        self._write_char = services.get_characteristic(UUID_WRITE)
+        if self._write_char is not None:
+            self._write_response = "write-without-response" not in self._write_char.properties
+        return notify_char or UUID_NOTIFY
 
+    def _tune_connection_interval(self):
+        """
+        Write CONN_MIN_INTERVAL/CONN_MAX_INTERVAL to the adapter's debugfs knobs,
+        which BlueZ uses for the connections it creates from then on.
+        """
+        adapter_dir = os.path.join(_DEBUGFS_BLUETOOTH, self.adapter or "hci0")
+        # Min first: it has to stay <= the current max, which is larger than our target
+        for name, value in (("conn_min_interval", CONN_MIN_INTERVAL), ("conn_max_interval", CONN_MAX_INTERVAL)):
+            try:
+                with open(os.path.join(adapter_dir, name), "w") as f:
+                    f.write(str(value))
+            except OSError as e:
+                self.logger.debug(f"Could not set {name} (ignored): {e}")
+                return
+
+    async def _acquire_mtu(self):
+        """
+        Make sure a larger ATT MTU is in effect so multi-frame responses need fewer packets.
+
+        BlueZ negotiates the MTU itself but bleak only learns it after AcquireWrite;
+        other backends already report the negotiated value after connect.
+        """
+        acquire = getattr(self.client._backend, "_acquire_mtu", None)
+        if acquire is not None:
+            try:
+                await acquire()
+            except Exception as e:
+                self.logger.debug(f"MTU exchange failed (ignored): {e}")
+        self.logger.info(f"ATT MTU is {self.client.mtu_size}")
 
     async def disconnect(self):
         """
         Disconnect from the Bluetooth device
         """
         self.logger.info("Bluetooth Disconnecting")
+        self._connected = False
         await self.client.disconnect()
         self.logger.info("Bluetooth Disconnected")
 
-    async def _read_request(self, command, extra="", max_responses=1, return_list=False, retries=5):
-        self.logger.debug(f"Sending command {command} with max responses {max_responses}")
+    async def _read_request(self, command, extra="", max_responses=1, retries=5):
+        log = self.logger
+        debug = log.isEnabledFor(logging.DEBUG)
+        if debug:
+            log.debug("Sending command %s with max responses %s", command, max_responses)
         for attempt in range(retries):
             try:
                 responses = await self._read(command, extra=extra, max_responses=max_responses)
                 if not responses:
-                    self.logger.warning(f"No response received for command {command} (attempt {attempt + 1}/{retries})")
+                    log.warning(f"No response received for command {command} (attempt {attempt + 1}/{retries})")
                     continue
-                if isinstance(responses, list):
+                if debug:
                     for response in responses:
-                        self.logger.debug(f"Received response for command {command}: {response.hex()}")
-                        if len(response) not in [13, 26]:
-                            pass
-                    return responses if return_list or max_responses > 1 else responses[-1] if responses else None
-                else:
-                    self.logger.debug(f"Received response for command {command}: {responses.hex()}")
-                    if len(responses) not in [13, 26]:
-                        pass
-                    return [responses] if return_list or max_responses > 1 else responses
+                        log.debug("Received response for command %s: %s", command, response.hex())
+                return responses
             except asyncio.TimeoutError:
-                self.logger.warning(f"Timeout while waiting for {command} response (attempt {attempt + 1}/{retries})")
+                log.warning(f"Timeout while waiting for {command} response (attempt {attempt + 1}/{retries})")
             except Exception as e:
-                self.logger.error(f"Error for command {command}: {e}")
+                log.error(f"Error for command {command}: {e}")
                 break
-        self.logger.error(f"{command} failed after {retries} tries")
+        log.error(f"{command} failed after {retries} tries")
         # After all retries failed, disconnect and raise to trigger restart
         try:
             await self.disconnect()
-            self.logger.info("Bluetooth connection closed after repeated failures. Restarting main loop.")
+            log.info("Bluetooth connection closed after repeated failures. Restarting main loop.")
         except Exception as e:
-            self.logger.error(f"Error during forced disconnect: {e}")
+            log.error(f"Error during forced disconnect: {e}")
         raise RuntimeError(f"No response for command {command} after {retries} attempts. Restarting.")
 
     async def _read(self, command, extra="", max_responses=1):
-        self.logger.debug("-- %s ------------------------" % command)
-        self.response_cache[command] = {"queue": [], "future": asyncio.Future(), "max_responses": max_responses,
-                                        "done": False}
+        log = self.logger
+        debug = log.isEnabledFor(logging.DEBUG)
+        if debug:
+            log.debug("-- %s ------------------------", command)
         message_bytes = self._format_message(command, extra=extra)
+        # Keyed by the command byte as an int, which is what the notification callback reads back
+        slot = self._slot(message_bytes[2])
+        slot["queue"] = []
+        slot["result"] = None
+        slot["max_responses"] = max_responses
+        slot["done"] = False
+        slot["event"].clear()
         result = await self._async_char_write(command, message_bytes)
-        self.logger.debug("got %s" % result)
+        if debug:
+            log.debug("got %s", result)
         if not result:
             return False
         return result
 
+    def _slot(self, command):
+        slot = self.response_cache.get(command)
+        if slot is None:
+            slot = self.response_cache[command] = {"queue": [], "event": asyncio.Event(), "result": None,
+                                                   "max_responses": 0, "done": True}
+        return slot
+
     def _notification_callback(self, sender, data):
         # NOTE: bleak 0.19+ callback signature is (sender: BleakGATTCharacteristic, data: bytearray)
         # Previous was (handle: int, data: bytearray)
         
-        # Get handle from sender if possible, or just ignore it
-        handle = sender.handle if hasattr(sender, 'handle') else sender
-        
-        self.logger.debug(f"[notification_callback] handle={handle}, data={data.hex()}, len={len(data)}")
-        responses = []
-        if len(data) == 13:
-            crc_calc = int.from_bytes(self._calc_crc(data[:12]), 'little')
-            self.logger.debug(f"[notification_callback] 13 bytes: CRC calc={crc_calc}, CRC recv={data[12]}")
-            if crc_calc != data[12]:
-                self.logger.info("Return from BMS: CRC wrong")
-                return
-            responses.append(data)
-        elif len(data) == 26:
-            crc1 = int.from_bytes(self._calc_crc(data[:12]), 'little')
-            crc2 = int.from_bytes(self._calc_crc(data[13:25]), 'little')
-            self.logger.debug(f"[notification_callback] 26 bytes: CRC1 calc={crc1}, CRC1 recv={data[12]}, CRC2 calc={crc2}, CRC2 recv={data[25]}")
-            if (crc1 != data[12]) or (crc2 != data[25]):
-                self.logger.info("Return from BMS: CRC wrong")
-                return
-            responses.append(data[:13])
-            responses.append(data[13:])
-        elif len(data) == 39:
-            self.logger.debug("[notification_callback] 39 bytes: splitting into three 13-byte packets")
-            for i in range(0, 39, 13):
-                packet = data[i:i+13]
-                if len(packet) == 13 and packet[0] == 0xA5 and packet[2] == 0x95:
-                    crc_calc = int.from_bytes(self._calc_crc(packet[:12]), 'little')
-                    self.logger.debug(f"[notification_callback] packet offset={i}, CRC calc={crc_calc}, CRC recv={packet[12]}, packet={packet.hex()}")
-                    if crc_calc == packet[12]:
-                        responses.append(packet)
-                    else:
-                        self.logger.info(f"CRC wrong for packet: {packet.hex()}")
-                else:
-                    self.logger.debug(f"Skipping invalid packet at offset {i}: {packet.hex()}")
-        elif len(data) == 200:
-            self.logger.debug("[notification_callback] 200 bytes: splitting into 13-byte packets")
-            for i in range(0, len(data), 13):
-                if i + 13 <= len(data) and data[i] == 0xA5 and data[i + 2] == 0x95:
-                    packet = data[i:i + 13]
-                    crc_calc = int.from_bytes(self._calc_crc(packet[:12]), 'little')
-                    self.logger.debug(f"[notification_callback] packet offset={i}, CRC calc={crc_calc}, CRC recv={packet[12]}, packet={packet.hex()}")
-                    if crc_calc == packet[12]:
-                        responses.append(packet)
-                    else:
-                        self.logger.info(f"CRC wrong for packet: {packet.hex()}")
-                else:
-                    self.logger.debug(f"Skipping invalid packet at offset {i}: {data[i:i + 13].hex()}")
-        else:
-            self.logger.debug(f"[notification_callback] Unhandled data length: {len(data)}")
+        # Formatting (hex dumps especially) is skipped entirely unless DEBUG is on
+        log = self.logger
+        debug = log.isEnabledFor(logging.DEBUG)
+        if debug:
+            # Get handle from sender if possible, or just ignore it
+            handle = sender.handle if hasattr(sender, 'handle') else sender
+            log.debug("[notification_callback] handle=%s, data=%s, len=%i", handle, data.hex(), len(data))
+        handler = self._notification_handlers.get(len(data))
+        if handler is None and len(data) % 13 == 0:
+            # Any other whole number of packets is a longer cell voltage burst (packs above 24 cells)
+            handler = self._split_cell_packets
+        if handler is None:
+            if debug:
+                log.debug("[notification_callback] Unhandled data length: %i", len(data))
             return
-            
+        # Packets are zero-copy views into the notification; only the queued payloads get copied
+        responses = handler(data, memoryview(data), debug)
+
         for response_bytes in responses:
-            command = response_bytes[2:3].hex()
-            self.logger.debug(f"[notification_callback] Parsed command: {command}, response_bytes={response_bytes.hex()}")
-            if self.response_cache.get(command, {}).get("done", True):
-                self.logger.debug(f"[notification_callback] Skipping response for {command}, done - received more data than expected")
+            command = response_bytes[2]
+            if debug:
+                log.debug("[notification_callback] Parsed command: %02x, response_bytes=%s", command, response_bytes.hex())
+            slot = self.response_cache.get(command)
+            if slot is None or slot["done"]:
+                if debug:
+                    log.debug("[notification_callback] Skipping response for %02x, done - received more data than expected", command)
                 return
-            self.response_cache[command]["queue"].append(response_bytes[4:-1])
-            self.logger.debug(f"[notification_callback] Appended response_bytes[4:-1]={response_bytes[4:-1].hex()} to queue for command {command}")
-            if len(self.response_cache[command]["queue"]) >= self.response_cache[command]["max_responses"]:
-                self.response_cache[command]["done"] = True
-                self.response_cache[command]["future"].set_result(self.response_cache[command]["queue"])
-                self.logger.debug(f"[notification_callback] Set future result for command {command}")
+            # The 8 payload bytes stay a bytes object: the DalyBMS parsers unpack them with struct
+            payload = response_bytes[4:12].tobytes()
+            queue = slot["queue"]
+            queue.append(payload)
+            if debug:
+                log.debug("[notification_callback] Appended payload=%s to queue for command %02x", payload.hex(), command)
+            if len(queue) >= slot["max_responses"]:
+                slot["done"] = True
+                slot["result"] = queue
+                slot["event"].set()
+                if debug:
+                    log.debug("[notification_callback] Set result for command %02x", command)
+
+    # Notification splitters, picked by length through _notification_handlers. Each returns
+    # the CRC-checked 13-byte packets of a notification. Daly's checksum is the low byte of
+    # the sum of the first 12 bytes (see DalyBMS._calc_crc), computed inline here since this
+    # runs for every packet of every notification.
+
+    def _split_single(self, data, mv, debug):
+        crc_calc = sum(mv[:12]) & 0xFF
+        if debug:
+            self.logger.debug("[notification_callback] 13 bytes: CRC calc=%s, CRC recv=%s", crc_calc, data[12])
+        if crc_calc != data[12]:
+            self.logger.info("Return from BMS: CRC wrong")
+            return ()
+        return (mv,)
+
+    def _split_pair(self, data, mv, debug):
+        crc1 = sum(mv[:12]) & 0xFF
+        crc2 = sum(mv[13:25]) & 0xFF
+        if debug:
+            self.logger.debug("[notification_callback] 26 bytes: CRC1 calc=%s, CRC1 recv=%s, CRC2 calc=%s, CRC2 recv=%s",
+                              crc1, data[12], crc2, data[25])
+        if (crc1 != data[12]) or (crc2 != data[25]):
+            self.logger.info("Return from BMS: CRC wrong")
+            return ()
+        return mv[:13], mv[13:]
+
+    def _split_cell_packets(self, data, mv, debug):
+        # Multi-packet cell voltage notification of any length: walk the complete 13-byte packets,
+        # the tail of a 200-byte one is padding
+        log = self.logger
+        if debug:
+            log.debug("[notification_callback] %i bytes: splitting into 13-byte packets", len(data))
+        responses = []
+        for i in range(0, len(data) - 12, 13):
+            if data[i] == 0xA5 and data[i + 2] == 0x95:
+                packet = mv[i:i + 13]
+                crc_calc = sum(packet[:12]) & 0xFF
+                if debug:
+                    log.debug("[notification_callback] packet offset=%i, CRC calc=%s, CRC recv=%s, packet=%s",
+                              i, crc_calc, packet[12], packet.hex())
+                if crc_calc == packet[12]:
+                    responses.append(packet)
+                else:
+                    log.info(f"CRC wrong for packet: {packet.hex()}")
+            elif debug:
+                log.debug("Skipping invalid packet at offset %i: %s", i, data[i:i + 13].hex())
+        return responses
 
     async def _async_char_write(self, command, value):
-        if not self.client.is_connected:
+        if not self._connected:
             self.logger.info("Connecting...")
-            await self.client.connect()
+            await self.connect()
         
-        # Write to the WRITE UUID
-        await self.client.write_gatt_char(UUID_WRITE, value)
+        # Write to the WRITE characteristic
+        async with self._write_lock:
+            await self.client.write_gatt_char(
+                self._write_char or UUID_WRITE, value, response=self._write_response
+            )
         
         self.logger.debug("Waiting...")
+        slot = self.response_cache[value[2]]
         try:
-            result = await asyncio.wait_for(self.response_cache[command]["future"], 15)  # Increased to 15s
+            await asyncio.wait_for(slot["event"].wait(), 15)  # Increased to 15s
         except asyncio.TimeoutError:
             self.logger.warning("Timeout while waiting for %s response" % command)
             return False
-        self.logger.debug("got %s" % result)
+        result = slot["result"]
+        self.logger.debug("got %s", result)
         return result
 
+    async def _query(self, command, parse, max_responses=1, **kwargs):
+        """
+        Single dispatch point for the wrappers below: request `command` and hand
+        the payloads to the synchronous DalyBMS parser `parse`.
+        """
+        response_data = await self._read_request(command, max_responses=max_responses)
+        return parse(self, response_data=response_data, **kwargs)
+
     # wrap all sync functions so that they can be awaited
     async def get_soc(self):
-        response_data = await self._read_request("90")
-        return super().get_soc(response_data=response_data)
+        return await self._query("90", DalyBMS.get_soc)
 
     async def get_cell_voltage_range(self):
-        response_data = await self._read_request("91")
-        return super().get_cell_voltage_range(response_data=response_data)
+        return await self._query("91", DalyBMS.get_cell_voltage_range)
 
     async def get_alarm_voltages(self, pack_cell=None):
-        if pack_cell == "Cell":
-            cmd = "59"
-        elif pack_cell == "Pack":
-            cmd = "5a"
-        else:
+        cmd = _ALARM_VOLTAGE_COMMANDS.get(pack_cell)
+        if cmd is None:
             self.logger.error("Wrong Call to alarm_voltages, missing Pack or Cell")
             return None
-        response_data = await self._read_request(cmd)
-        return super().get_alarm_voltages(response_data=response_data, pack_cell=pack_cell)
+        return await self._query(cmd, DalyBMS.get_alarm_voltages, pack_cell=pack_cell)
 
     async def get_temperature_range(self):
-        response_data = await self._read_request("92")
-        return super().get_temperature_range(response_data=response_data)
+        return await self._query("92", DalyBMS.get_temperature_range)
 
     async def get_hw_sw_version(self, hard_soft):
-        if hard_soft == "Hardware":
-            cmd = "63"
-        elif hard_soft == "Software":
-            cmd = "62"
-        else:
+        cmd = _VERSION_COMMANDS.get(hard_soft)
+        if cmd is None:
             self.logger.error("No Hard/Software selected for version query")
             return None
-        response_data = await self._read_request(cmd, max_responses=2)
-        return super().get_hw_sw_version(response_data=response_data, hard_soft=hard_soft)
+        return await self._query(cmd, DalyBMS.get_hw_sw_version, max_responses=2, hard_soft=hard_soft)
 
     async def get_mosfet_status(self):
-        response_data = await self._read_request("93")
-        return super().get_mosfet_status(response_data=response_data)
+        return await self._query("93", DalyBMS.get_mosfet_status)
 
     async def get_status(self):
-        response_data = await self._read_request("94")
-        return super().get_status(response_data=response_data)
+        """
+        Cached for STATUS_TTL seconds, and concurrent callers share one request, so
+        get_cell_voltages/get_temperatures running together cost at most one round trip.
+        """
+        if self.status and time.monotonic() - self._status_ts < STATUS_TTL:
+            return self.status
+        task = self._status_task
+        if task is None or task.done():
+            task = self._status_task = asyncio.ensure_future(self._fetch_status())
+        return await task
+
+    async def _fetch_status(self):
+        status = await self._query("94", DalyBMS.get_status)
+        if status:
+            self._status_ts = time.monotonic()
+        return status
 
     async def get_cell_voltages(self):
         if not self.status:
             await self.get_status()
         max_responses = self._calc_num_responses('cells', 3)
-        self.logger.debug(f"[get_cell_voltages] Calculated max_responses: {max_responses}")
+        self.logger.debug("[get_cell_voltages] Calculated max_responses: %s", max_responses)
         if not max_responses:
             self.logger.warning("[get_cell_voltages] max_responses is None or 0, aborting.")
             return None
-        self.logger.debug(f"[get_cell_voltages] Sending _read_request for command 95 with max_responses={max_responses}")
-        response_data = await self._read_request("95", max_responses=max_responses)
-        self.logger.debug(f"[get_cell_voltages] Response data for command 95: {response_data}")
-        return super().get_cell_voltages(response_data=response_data)
+        return await self._query("95", DalyBMS.get_cell_voltages, max_responses=max_responses)
 
     async def get_temperatures(self):
         if not self.status:
             await self.get_status()
         max_responses = self._calc_num_responses('temperature_sensors', 7)
-        response_data = await self._read_request("96", max_responses=max_responses)
-        return super().get_temperatures(response_data=response_data)
+        return await self._query("96", DalyBMS.get_temperatures, max_responses=max_responses)
 
     async def get_balancing_status(self):
-        response_data = await self._read_request("97")
-        return super().get_balancing_status(response_data=response_data)
+        return await self._query("97", DalyBMS.get_balancing_status)
 
     async def get_alarms_diff_temp_volt(self):
-        response_data = await self._read_request("5e")
-        return super().get_alarms_diff_temp_volt(response_data=response_data)
+        return await self._query("5e", DalyBMS.get_alarms_diff_temp_volt)
 
     async def get_alarms_load_charge(self):
-        response_data = await self._read_request("5b")
-        return super().get_alarms_load_charge(response_data=response_data)
+        return await self._query("5b", DalyBMS.get_alarms_load_charge)
 
     async def get_rated_nominals(self):
-        response_data = await self._read_request("50")
-        return super().get_rated_nominals(response_data=response_data)
+        return await self._query("50", DalyBMS.get_rated_nominals)
 
     async def get_balance_settings(self):
-        response_data = await self._read_request("5f")
-        return super().get_balance_settings(response_data=response_data)
+        return await self._query("5f", DalyBMS.get_balance_settings)
 
     async def get_short_shutdownamp_ohm(self):
-        response_data = await self._read_request("60")
-        return super().get_short_shutdownamp_ohm(response_data=response_data)
+        return await self._query("60", DalyBMS.get_short_shutdownamp_ohm)
 
     async def get_errors(self):
-        response_data = await self._read_request("98")
-        return super().get_errors(response_data=response_data)
+        return await self._query("98", DalyBMS.get_errors)
+
+    async def get_all(self):
+        """
+        Async counterpart of DalyBMS.get_all. Responses are matched to requests by
+        command byte, so everything after the status query is requested concurrently;
+        the status goes first because the cell/temperature frame counts depend on it.
+        """
+        status = await self.get_status()
+        (soc, cell_voltage_range, temperature_range, mosfet_status, cell_voltages,
+         temperatures, balancing_status, errors) = await asyncio.gather(
+            self.get_soc(),
+            self.get_cell_voltage_range(),
+            self.get_temperature_range(),
+            self.get_mosfet_status(),
+            self.get_cell_voltages(),
+            self.get_temperatures(),
+            self.get_balancing_status(),
+            self.get_errors(),
+        )
+        return {
+            "soc": soc,
+            "cell_voltage_range": cell_voltage_range,
+            "temperature_range": temperature_range,
+            "mosfet_status": mosfet_status,
+            "status": status,
+            "cell_voltages": cell_voltages,
+            "temperatures": temperatures,
+            "balancing_status": balancing_status,
+            "errors": errors
+        }
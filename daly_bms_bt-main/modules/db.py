@@ -1,5 +1,68 @@
+import io
+import struct
+import datetime
 import psycopg2
 import logging
+import weakref
+from contextlib import contextmanager
+from functools import lru_cache
+from psycopg2 import sql
+from psycopg2.extras import execute_batch
+from psycopg2.pool import ThreadedConnectionPool
+
+# COPY ... (FORMAT BINARY) framing, see the PostgreSQL COPY documentation
+_COPY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('>ii', 0, 0)
+_COPY_TRAILER = struct.pack('>h', -1)
+_COPY_NULL = struct.pack('>i', -1)
+# Field count followed by the length-prefixed TIMESTAMPTZ (microseconds since 2000-01-01 UTC)
+_COPY_ROW_HEAD = struct.Struct('>hiq')
+_COPY_REAL = struct.Struct('>if')
+# One-dimensional int2 array: ndim, has-null flag, element OID, length, lower bound
+_COPY_ARRAY_HEAD = struct.Struct('>iiiiii')
+_INT2_OID = 21
+_PG_EPOCH = datetime.datetime(2000, 1, 1, tzinfo=datetime.timezone.utc)
+_ONE_MICROSECOND = datetime.timedelta(microseconds=1)
+
+_BMS_COLUMNS = ('create_date', 'total_voltage', 'current', 'soc_percent', 'cell_voltages')
+
+
+def _cells_to_mv(cell_voltages):
+    # Stored as int mV, one array element per cell whatever the pack size.
+    # Cell voltages are never negative, so adding 0.5 and truncating rounds them
+    return [int(v * 1000 + 0.5) for v in cell_voltages]
+
+
+def _encode_copy_int2_array(values):
+    n = len(values)
+    head = _COPY_ARRAY_HEAD.pack(20 + 6 * n, 1, 0, _INT2_OID, n, 1)
+    return head + struct.pack('>' + 'ih' * n, *[x for v in values for x in (2, v)])
+
+
+@lru_cache(maxsize=None)
+def _bms_statements(table_name):
+    """Compose the PREPARE, EXECUTE and COPY statements for a BMS table once."""
+    table = sql.Identifier(table_name)
+    statement = sql.Identifier(f'{table_name}_insert')
+    columns = sql.SQL(', ').join(map(sql.Identifier, _BMS_COLUMNS))
+    params = sql.SQL(', ').join(sql.SQL(f'${i}') for i in range(1, len(_BMS_COLUMNS) + 1))
+    prepare = sql.SQL('PREPARE {} AS INSERT INTO {} ({}) VALUES ({})').format(statement, table, columns, params)
+    execute = sql.SQL('EXECUTE {} ({})').format(statement, sql.SQL(', ').join(sql.Placeholder() * len(_BMS_COLUMNS)))
+    copy = sql.SQL('COPY {} ({}) FROM STDIN WITH (FORMAT BINARY)').format(table, columns)
+    return prepare, execute, copy
+
+
+def _encode_copy_binary(rows):
+    buf = io.BytesIO()
+    buf.write(_COPY_HEADER)
+    for create_date, total_voltage, current, soc_percent, cell_voltages in rows:
+        buf.write(_COPY_ROW_HEAD.pack(len(_BMS_COLUMNS), 8, (create_date - _PG_EPOCH) // _ONE_MICROSECOND))
+        for value in (total_voltage, current, soc_percent):
+            buf.write(_COPY_NULL if value is None else _COPY_REAL.pack(4, value))
+        buf.write(_encode_copy_int2_array(_cells_to_mv(cell_voltages)))
+    buf.write(_COPY_TRAILER)
+    buf.seek(0)
+    return buf
+
 
 class PostgresDB:
 
@@ -12,55 +75,86 @@ class PostgresDB:
             total_voltage REAL,
             current REAL,
             soc_percent REAL,
-            cell_1 SMALLINT,
-            cell_2 SMALLINT,
-            cell_3 SMALLINT,
-            cell_4 SMALLINT,
-            cell_5 SMALLINT,
-            cell_6 SMALLINT,
-            cell_7 SMALLINT,
-            cell_8 SMALLINT
+            cell_voltages SMALLINT[] NOT NULL
         );
+        -- Tables created with the old cell_1..cell_8 columns gain the array column, filled
+        -- from those columns once and then made NOT NULL like on new tables. The old
+        -- columns are left in place, unused
+        ALTER TABLE {table_name} ADD COLUMN IF NOT EXISTS cell_voltages SMALLINT[];
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_schema = current_schema() AND table_name = '{table_name}'
+                    AND column_name = 'cell_voltages' AND is_nullable = 'YES'
+            ) THEN
+                IF EXISTS (
+                    SELECT 1 FROM information_schema.columns
+                    WHERE table_schema = current_schema() AND table_name = '{table_name}'
+                        AND column_name = 'cell_1'
+                ) THEN
+                    UPDATE {table_name}
+                    SET cell_voltages = ARRAY[cell_1, cell_2, cell_3, cell_4, cell_5, cell_6, cell_7, cell_8]
+                    WHERE cell_voltages IS NULL;
+                END IF;
+                ALTER TABLE {table_name} ALTER COLUMN cell_voltages SET NOT NULL;
+            END IF;
+        END $$;
+        -- Readers want the newest samples: latest-N queries walk this index instead of sorting the table
+        CREATE INDEX IF NOT EXISTS idx_{table_name}_create_date ON {table_name} (create_date DESC);
         '''
 
     def insert_bms_data(self, table_name, create_date, total_voltage, current, soc_percent, cell_voltages):
-        # cell_voltages: list or tuple of values (store as int mV)
-        # Adapt to old structure: ensure exactly 8 values (pad with 0 if fewer, truncate if more)
-        cell_voltages_int = [0] * 8
-        for i, v in enumerate(cell_voltages[:8]):
-            cell_voltages_int[i] = int(round(v * 1000))
-
-        insert_sql = f'''
-            INSERT INTO {table_name} (create_date, total_voltage, current, soc_percent, cell_1, cell_2, cell_3, cell_4, cell_5, cell_6, cell_7, cell_8)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        '''
-        params = (create_date, total_voltage, current, soc_percent, *cell_voltages_int)
-        self.insert(insert_sql, params)
+        # cell_voltages: list or tuple of values, sent as one SMALLINT[] of mV
+        params = (create_date, total_voltage, current, soc_percent, _cells_to_mv(cell_voltages))
+        # Same prepared statement as the batch path, but errors are raised to the caller
+        with self._pooled_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(self._prepare_insert(conn, cur, table_name), params)
         self.logger.info('BMS data inserted successfully.')
 
     def insert_bms_data_safe(self, table_name, create_date, total_voltage, current, soc_percent, cell_voltages):
-        """Open a short-lived connection for inserts to avoid blocking the event loop thread."""
-        cell_voltages_int = [0] * 8
-        for i, v in enumerate(cell_voltages[:8]):
-            cell_voltages_int[i] = int(round(v * 1000))
-
-        insert_sql = f'''
-            INSERT INTO {table_name} (create_date, total_voltage, current, soc_percent, cell_1, cell_2, cell_3, cell_4, cell_5, cell_6, cell_7, cell_8)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        '''
-        params = (create_date, total_voltage, current, soc_percent, *cell_voltages_int)
+        """Insert a single sample through the prepared batch path; safe to run in an executor thread."""
+        self.insert_bms_rows_batch(table_name, [(create_date, total_voltage, current, soc_percent, cell_voltages)])
+
+    def insert_bms_rows_batch(self, table_name, rows, page_size=100):
+        """
+        Insert many buffered samples, sending up to page_size EXECUTEs of the prepared INSERT per round-trip.
+
+        :param rows: list of (create_date, total_voltage, current, soc_percent, cell_voltages) tuples
+        """
+        values = [
+            (create_date, total_voltage, current, soc_percent, _cells_to_mv(cell_voltages))
+            for create_date, total_voltage, current, soc_percent, cell_voltages in rows
+        ]
         try:
-            with psycopg2.connect(**self.config) as conn:
+            with self._pooled_connection() as conn:
                 with conn.cursor() as cur:
-                    cur.execute(insert_sql, params)
-                conn.commit()
-            self.logger.info('BMS data inserted successfully.')
+                    execute_sql = self._prepare_insert(conn, cur, table_name)
+                    execute_batch(cur, execute_sql, values, page_size=page_size)
+            self.logger.info(f'{len(values)} BMS rows inserted successfully.')
         except Exception as e:
-            self.logger.error(f'Error inserting data (safe): {e}')
-        
-    def __init__(self, host, port, dbname, user, password, logger=None):
+            self.logger.error(f'Error inserting batch of {len(values)} rows: {e}')
+
+    def _prepare_insert(self, conn, cur, table_name):
+        # Prepared statements live for the whole session, so parse/plan the INSERT once per connection
+        prepared = self._prepared.setdefault(conn, {})
+        execute_sql = prepared.get(table_name)
+        if execute_sql is None:
+            prepare, execute, _ = _bms_statements(table_name)
+            cur.execute(prepare)
+            # Rendered once here since execute_batch mogrifies it for every row
+            execute_sql = prepared[table_name] = execute.as_string(conn)
+        return execute_sql
+
+    def __init__(self, host, port, dbname, user, password, logger=None, minconn=1, maxconn=4):
         self.logger = logger or logging.getLogger('daly_bms')
-        self.conn = None
+        self.pool = None
+        self.minconn = minconn
+        self.maxconn = maxconn
+        # connection -> {table_name: rendered EXECUTE statement PREPAREd on it}. Keyed by the
+        # object, not id(), so connections the pool closes and drops take their entry with them
+        self._prepared = weakref.WeakKeyDictionary()
         self.config = {
             'host': host,
             'port': port,
@@ -71,31 +165,68 @@ class PostgresDB:
 
     def connect(self):
         try:
-            self.conn = psycopg2.connect(**self.config)
+            # Every query checks a connection out of the pool, so concurrent flushes
+            # each get their own and nothing reconnects per insert
+            self.pool = ThreadedConnectionPool(self.minconn, self.maxconn, **self.config)
             self.logger.info('Connected to PostgreSQL database.')
         except Exception as e:
             self.logger.error(f'Failed to connect to PostgreSQL: {e}')
             raise
 
+    def copy_bms_rows(self, table_name, rows):
+        """
+        Bulk load buffered samples with COPY ... FROM STDIN (FORMAT BINARY).
+
+        :param rows: list of (create_date, total_voltage, current, soc_percent, cell_voltages) tuples
+        """
+        _, _, copy_sql = _bms_statements(table_name)
+        try:
+            with self._pooled_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.copy_expert(copy_sql, _encode_copy_binary(rows))
+            self.logger.info(f'{len(rows)} BMS rows copied successfully.')
+        except Exception as e:
+            self.logger.error(f'Error copying batch of {len(rows)} rows: {e}')
+
+    @contextmanager
+    def _pooled_connection(self, commit=True):
+        """
+        Check a connection out of the pool and commit (or, with commit=False, roll back)
+        before returning it. Errors always roll back.
+        """
+        conn = self.pool.getconn()
+        try:
+            yield conn
+            if commit:
+                conn.commit()
+            else:
+                conn.rollback()
+        except Exception:
+            if not conn.closed:
+                conn.rollback()
+            raise
+        finally:
+            # Broken connections are discarded so the pool opens a fresh one next time
+            self.pool.putconn(conn, close=bool(conn.closed))
+
     def close(self):
-        if self.conn:
-            self.conn.close()
+        if self.pool:
+            self.pool.closeall()
+            self._prepared.clear()
             self.logger.info('PostgreSQL connection closed.')
 
     def execute(self, query, params=None, commit=False):
+        # Committed when commit is True, otherwise rolled back, as the connection is handed back
         try:
-            with self.conn.cursor() as cur:
-                cur.execute(query, params)
-                if commit:
-                    self.conn.commit()
-                try:
-                    return cur.fetchall()
-                except psycopg2.ProgrammingError:
-                    return None
+            with self._pooled_connection(commit) as conn:
+                with conn.cursor() as cur:
+                    cur.execute(query, params)
+                    try:
+                        return cur.fetchall()
+                    except psycopg2.ProgrammingError:
+                        return None
         except Exception as e:
             self.logger.error(f'Error executing query: {e}')
-            if commit:
-                self.conn.rollback()
             raise
 
     def create_table(self, table_sql):
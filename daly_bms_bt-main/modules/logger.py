@@ -2,38 +2,50 @@ import logging
 import os
 import glob
 import time
-from logging.handlers import TimedRotatingFileHandler
+import atexit
+import queue
+from logging.handlers import TimedRotatingFileHandler, QueueHandler, QueueListener
 
-class LevelFilter(logging.Filter):
-    def __init__(self, level):
-        super().__init__()
-        self.level = level
-    def filter(self, record):
-        return record.levelno == self.level
+def exact_level(level):
+    # Plain callable filter (accepted by addFilter) letting through only records of this exact level
+    return lambda record: record.levelno == level
 
 
 
 # Use TimedRotatingFileHandler for time-based rotation and compression
+# (StreamHandler.emit already flushes after every record)
 class FlushTimedRotatingFileHandler(TimedRotatingFileHandler):
-    def emit(self, record):
-        super().emit(record)
-        self.flush()
+    def __init__(self, *args, retention_days=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.retention_days = retention_days
+
     def doRollover(self):
         super().doRollover()
         # Compress the most recent rotated log file in a separate thread to avoid blocking
+        import gzip
         import shutil
         import threading
         def compress_logs():
             if self.backupCount > 0:
-                log_dir, base = os.path.split(self.baseFilename)
                 rotated_files = sorted(glob.glob(f"{self.baseFilename}.*"), reverse=True)
                 for f in rotated_files[:self.backupCount]:
                     if not f.endswith('.gz') and os.path.isfile(f):
                         try:
-                            shutil.make_archive(f, 'gztar', root_dir=log_dir, base_dir=os.path.basename(f))
+                            # Single file, so plain gzip: no tar wrapper or temp file
+                            with open(f, 'rb') as src, gzip.open(f + '.gz', 'wb', compresslevel=6) as dst:
+                                shutil.copyfileobj(src, dst, 1024 * 1024)
                             os.remove(f)
                         except Exception:
                             pass # Ignore errors during compression
+            # Log retention: delete logs older than retention_days, once per rotation
+            if self.retention_days:
+                cutoff = time.time() - self.retention_days * 86400
+                for f in glob.glob(f"{self.baseFilename}*"):
+                    try:
+                        if os.path.isfile(f) and os.path.getmtime(f) < cutoff:
+                            os.remove(f)
+                    except OSError:
+                        pass
         threading.Thread(target=compress_logs).start()
 
 _LOGGER = None
@@ -63,44 +75,43 @@ def get_logger(level='debug'):
     backup_count = 30  # Keep 30 days of logs
     retention_days = 30
 
+    # One formatter shared by every handler
+    formatter = logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s')
+
     # Info-level log file
-    fh_info = FlushTimedRotatingFileHandler(info_log_file, when=when, interval=interval, backupCount=backup_count, delay=False, encoding='utf-8')
+    fh_info = FlushTimedRotatingFileHandler(info_log_file, when=when, interval=interval, backupCount=backup_count, delay=False, encoding='utf-8', retention_days=retention_days)
     fh_info.setLevel(logging.INFO)
-    fh_info.addFilter(LevelFilter(logging.INFO))
-    fh_info.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
-    logger.addHandler(fh_info)
+    fh_info.addFilter(exact_level(logging.INFO))
+    fh_info.setFormatter(formatter)
 
-    fh_all = FlushTimedRotatingFileHandler(main_log_file, when=when, interval=interval, backupCount=backup_count, delay=False, encoding='utf-8')
+    fh_all = FlushTimedRotatingFileHandler(main_log_file, when=when, interval=interval, backupCount=backup_count, delay=False, encoding='utf-8', retention_days=retention_days)
     fh_all.setLevel(logging.INFO)
-    fh_all.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
-    logger.addHandler(fh_all)
+    fh_all.setFormatter(formatter)
 
-    fh_warn = FlushTimedRotatingFileHandler(warning_log_file, when=when, interval=interval, backupCount=backup_count, delay=False, encoding='utf-8')
+    fh_warn = FlushTimedRotatingFileHandler(warning_log_file, when=when, interval=interval, backupCount=backup_count, delay=False, encoding='utf-8', retention_days=retention_days)
     fh_warn.setLevel(logging.WARNING)
-    fh_warn.addFilter(LevelFilter(logging.WARNING))
-    fh_warn.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
-    logger.addHandler(fh_warn)
+    fh_warn.addFilter(exact_level(logging.WARNING))
+    fh_warn.setFormatter(formatter)
 
-    fh_err = FlushTimedRotatingFileHandler(error_log_file, when=when, interval=interval, backupCount=backup_count, delay=False, encoding='utf-8')
+    fh_err = FlushTimedRotatingFileHandler(error_log_file, when=when, interval=interval, backupCount=backup_count, delay=False, encoding='utf-8', retention_days=retention_days)
     fh_err.setLevel(logging.ERROR)
-    fh_err.addFilter(LevelFilter(logging.ERROR))
-    fh_err.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
-    logger.addHandler(fh_err)
-
-    # Log retention: delete logs older than retention_days
-    now = time.time()
-    for log_file in [main_log_file, info_log_file, warning_log_file, error_log_file]:
-        for f in glob.glob(f"{log_file}*"):
-            if os.path.isfile(f) and (now - os.path.getmtime(f)) > (retention_days * 86400):
-                os.remove(f)
+    fh_err.addFilter(exact_level(logging.ERROR))
+    fh_err.setFormatter(formatter)
 
     sh = logging.StreamHandler()
     numeric_level = getattr(logging, level.upper(), logging.INFO)
     sh.setLevel(numeric_level)
-    sh.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
-    logger.addHandler(sh)
+    sh.setFormatter(formatter)
     logger.setLevel(numeric_level)
 
+    # Records are still formatted on the caller's thread (QueueHandler.prepare); only the
+    # file and stream I/O moves to the listener thread
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, fh_info, fh_all, fh_warn, fh_err, sh, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
     logger.propagate = False
     _LOGGER = logger
     return logger
\ No newline at end of file
@@ -0,0 +1,74 @@
+import asyncio
+import os
+import sys
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# daly_bms_bt parses the command line at import
+with mock.patch.object(sys, "argv", ["daly_bms_bt.py", "--no-db"]):
+    import daly_bms_bt
+
+
+class FakeDB:
+    maxconn = 4
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.batches = []
+
+    def insert_bms_rows_batch(self, table_name, rows):
+        time.sleep(self.delay)
+        self.batches.append(list(rows))
+
+    copy_bms_rows = insert_bms_rows_batch
+
+    @property
+    def rows(self):
+        return sorted(row for batch in self.batches for row in batch)
+
+
+class DBWriterShutdownTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        patcher = mock.patch.multiple(daly_bms_bt, BATCH_SIZE=3, FLUSH_INTERVAL=0.05)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.executor.shutdown(wait=True)
+
+    async def test_stop_markers_flush_every_queued_row(self):
+        db = FakeDB(delay=0.02)
+        queue = asyncio.Queue()
+        writers = [asyncio.create_task(daly_bms_bt.db_writer(db, queue, self.executor)) for _ in range(2)]
+        for row in range(10):
+            await queue.put(row)
+        for _ in writers:
+            await queue.put(None)
+        await asyncio.wait_for(asyncio.gather(*writers), 5)
+        self.assertEqual(db.rows, list(range(10)))
+
+    async def test_stop_marker_ends_a_partial_batch(self):
+        db = FakeDB()
+        queue = asyncio.Queue()
+        writer = asyncio.create_task(daly_bms_bt.db_writer(db, queue, self.executor))
+        await queue.put(1)
+        await asyncio.sleep(0)
+        await queue.put(None)
+        await asyncio.wait_for(writer, 5)
+        self.assertEqual(db.batches, [[1]])
+
+    async def test_idle_writers_stop(self):
+        queue = asyncio.Queue()
+        writers = [asyncio.create_task(daly_bms_bt.db_writer(FakeDB(), queue, self.executor)) for _ in range(2)]
+        for _ in writers:
+            await queue.put(None)
+        await asyncio.wait_for(asyncio.gather(*writers), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
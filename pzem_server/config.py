@@ -1,5 +1,8 @@
 import os
+from functools import lru_cache
 
+# Environment variables don't change at runtime, so each device's config is built once
+@lru_cache(maxsize=None)
 def get_device_config(device_prefix):
     """
     Returns a configuration for a specific device (e.g., 'AC' or 'SOLAR').
@@ -15,10 +18,15 @@ def get_device_config(device_prefix):
         'serial_port': os.getenv(f'{device_prefix}_SERIAL_PORT', default_port),
         'baud_rate': int(os.getenv(f'{device_prefix}_BAUD_RATE', 9600)),
         'serial_timeout': int(os.getenv(f'{device_prefix}_SERIAL_TIMEOUT', 1)),
+        # Max silence between bytes of a response (seconds) before a read gives up early
+        'inter_byte_timeout': float(os.getenv(f'{device_prefix}_INTER_BYTE_TIMEOUT', 0.05)),
         'slave_address': int(os.getenv(f'{device_prefix}_SLAVE_ADDRESS', default_slave_address), 16)
     }
     
     return config
 
+# Built once at import; hot paths index this instead of calling get_device_config
+DEVICE_CONFIGS = {prefix: get_device_config(prefix) for prefix in ('AC', 'SOLAR')}
+
 # Precision for both systems
 PRECISION = int(os.getenv('PRECISION', 4))
@@ -1,7 +1,11 @@
 import psycopg2
 import os
 import logging
+import weakref
+from contextlib import contextmanager
 from datetime import datetime, timezone
+from psycopg2.extras import execute_batch
+from psycopg2.pool import ThreadedConnectionPool
 from power_data import get_power_data
 
 db_params = {
@@ -12,6 +16,52 @@ db_params = {
     "port": os.getenv("POSTGRES_PORT")
 }
 
+# Rows are buffered and written together every FLUSH_TICKS calls of save_to_database
+FLUSH_TICKS = int(os.getenv("DB_FLUSH_TICKS", 10))
+_ac_rows = []
+_solar_rows = []
+_pending_ticks = 0
+
+# Opened on first use and kept for the life of the process
+_pool = None
+# Pooled connections the INSERTs below have been PREPAREd on; weak, so connections
+# the pool closes and drops fall out of it instead of leaving a reusable id() behind
+_prepared = weakref.WeakSet()
+
+# Parsed and planned once per connection, then run with EXECUTE every tick
+PREPARE_INSERTS_SQL = """
+PREPARE ins_ac AS
+    INSERT INTO ac_monitor (create_date, voltage, current, power, energy, frequency, power_factor)
+    VALUES ($1, $2, $3, $4, $5, $6, $7);
+PREPARE ins_solar AS
+    INSERT INTO solar_monitor (create_date, voltage, current, power, energy)
+    VALUES ($1, $2, $3, $4, $5);
+"""
+
+def _get_pool():
+    global _pool
+    if _pool is None:
+        _pool = ThreadedConnectionPool(1, int(os.getenv("POSTGRES_POOL_SIZE", 4)), **db_params)
+    return _pool
+
+@contextmanager
+def get_connection():
+    """
+    Checks a connection out of the pool for one transaction: committed on success,
+    rolled back on error, then handed back (or discarded if it was closed).
+    """
+    pool = _get_pool()
+    conn = pool.getconn()
+    try:
+        with conn:
+            yield conn
+    finally:
+        pool.putconn(conn, close=bool(conn.closed))
+
+def _prepare_inserts(conn, cur):
+    if conn not in _prepared:
+        cur.execute(PREPARE_INSERTS_SQL)
+        _prepared.add(conn)
 
 
 def init_db():
@@ -26,6 +76,7 @@ def init_db():
         frequency DECIMAL(12, 4),
         power_factor DECIMAL(12, 4)
     );
+    CREATE INDEX IF NOT EXISTS idx_ac_monitor_create_date ON ac_monitor (create_date DESC);
     """
     create_solar_table_sql = """
     CREATE TABLE IF NOT EXISTS solar_monitor(
@@ -36,10 +87,11 @@ def init_db():
         power DECIMAL(20, 4),
         energy DECIMAL(12, 4)
     );
+    CREATE INDEX IF NOT EXISTS idx_solar_monitor_create_date ON solar_monitor (create_date DESC);
     """
     
     try:
-        with psycopg2.connect(**db_params) as conn:
+        with get_connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(create_ac_table_sql)
                 cur.execute(create_solar_table_sql)
@@ -50,51 +102,68 @@ def init_db():
 
 def save_to_database():
     """
-    Fetches power data, connects to the PostgreSQL database,
-    and securely saves the new data.
+    Fetches power data and buffers it; every FLUSH_TICKS calls the buffered
+    rows are written to the PostgreSQL database (see flush_to_database).
     """
+    global _pending_ticks
     data = get_power_data()
     ac_data = data.get('AC')
     solar_data = data.get('SOLAR')
-    current_timestamp_utc_fmt = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S.%f")
+    # create_date is a TIMESTAMP (no time zone) holding UTC: a naive datetime is adapted
+    # by psycopg2 as-is, with no strftime and no time zone conversion on the server
+    current_timestamp_utc = datetime.now(timezone.utc).replace(tzinfo=None)
     
+    if ac_data:
+        _ac_rows.append((
+            current_timestamp_utc,
+            ac_data.get('voltage'),
+            ac_data.get('current'),
+            ac_data.get('power'),
+            ac_data.get('energy'),
+            ac_data.get('frequency'),
+            ac_data.get('power_factor')
+        ))
+    else:
+        logging.warning("Failed to retrieve valid AC data.")
+
+    if solar_data and solar_data.get('power') != 0:
+        _solar_rows.append((
+            current_timestamp_utc,
+            solar_data.get('voltage'),
+            solar_data.get('current'),
+            solar_data.get('power'),
+            solar_data.get('energy')
+        ))
+    else:
+        logging.warning("Failed to retrieve valid Solar data.")
+
+    _pending_ticks += 1
+    if _pending_ticks >= FLUSH_TICKS:
+        flush_to_database()
+
+def flush_to_database():
+    """
+    Writes the buffered AC and solar rows in one transaction, sending up to 100
+    EXECUTEs of the prepared INSERT per round-trip. The buffer is emptied even
+    if the write fails, so an unreachable database can't grow it without bound.
+    """
+    global _pending_ticks
+    _pending_ticks = 0
+    if not _ac_rows and not _solar_rows:
+        return
+
     try:
-        with psycopg2.connect(**db_params) as conn:
+        with get_connection() as conn:
             with conn.cursor() as cur:
-                if ac_data:
-                    insert_ac_sql = """
-                    INSERT INTO ac_monitor (create_date, voltage, current, power, energy, frequency, power_factor)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s);
-                    """
-                    ac_values = (
-                        current_timestamp_utc_fmt,
-                        ac_data.get('voltage'),
-                        ac_data.get('current'),
-                        ac_data.get('power'),
-                        ac_data.get('energy'),
-                        ac_data.get('frequency'),
-                        ac_data.get('power_factor')
-                    )
-                    cur.execute(insert_ac_sql, ac_values)
-                else:
-                    logging.warning("Failed to retrieve valid AC data.")
-                    
-                if solar_data and solar_data.get('power') != 0:
-                    insert_solar_sql = """
-                    INSERT INTO solar_monitor (create_date, voltage, current, power, energy)
-                    VALUES (%s, %s, %s, %s, %s);
-                    """
-                    solar_values = (
-                        current_timestamp_utc_fmt,
-                        solar_data.get('voltage'),
-                        solar_data.get('current'),
-                        solar_data.get('power'),
-                        solar_data.get('energy')
-                    )
-                    cur.execute(insert_solar_sql, solar_values)
-                else:
-                    logging.warning("Failed to retrieve valid Solar data.")
+                _prepare_inserts(conn, cur)
+                if _ac_rows:
+                    execute_batch(cur, "EXECUTE ins_ac (%s, %s, %s, %s, %s, %s, %s)", _ac_rows, page_size=100)
+                if _solar_rows:
+                    execute_batch(cur, "EXECUTE ins_solar (%s, %s, %s, %s, %s)", _solar_rows, page_size=100)
     except psycopg2.Error as e:
         logging.error(f"Database operation ( Data Insertion ) failed: {e}")
     except Exception as e:
-        logging.error(f"Unexpected Error! Data Insertion failed: {e}")
\ No newline at end of file
+        logging.error(f"Unexpected Error! Data Insertion failed: {e}")
+    finally:
+        _ac_rows.clear()
+        _solar_rows.clear()
\ No newline at end of file
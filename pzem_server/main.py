@@ -1,24 +1,48 @@
 import os
 import time
+import signal
 import logging
 from dotenv import load_dotenv
-from database import save_to_database, init_db
 
+# Before the imports below: config, modbus, power_data and database read the
+# environment (serial ports, slave addresses, DB settings) when they are imported
 load_dotenv()
 
+from database import save_to_database, flush_to_database, init_db
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+try:
+    LOG_INTERVAL = int(os.getenv("LOG_INTERVAL", 1))
+except ValueError:
+    logging.error("LOG_INTERVAL environment variable is not a valid integer. Defaulting to 1 seconds.")
+    LOG_INTERVAL = 1
+
 init_db()
 
-while True:
-    try:
-        save_to_database()
-        time.sleep(int(os.getenv("LOG_INTERVAL",1)))
-    except TypeError:
-        logging.error("LOG_INTERVAL environment variable is not a valid integer. Defaulting to 1 seconds.")
-        time.sleep(5)
-    except Exception as e:
-        logging.error(f"Unexpected error, skipping save_to_db operation: {e}")
\ No newline at end of file
+# docker stop sends SIGTERM: exit through the finally below so buffered rows are written
+def handle_sigterm(signum, frame):
+    raise SystemExit(0)
+
+signal.signal(signal.SIGTERM, handle_sigterm)
+
+# Ticks are scheduled against fixed monotonic deadlines, so serial and DB time
+# doesn't add to the period and the sample rate doesn't drift
+try:
+    next_tick = time.monotonic()
+    while True:
+        try:
+            save_to_database()
+        except Exception as e:
+            logging.error(f"Unexpected error, skipping save_to_db operation: {e}")
+        next_tick += LOG_INTERVAL
+        now = time.monotonic()
+        if now - next_tick > 2 * LOG_INTERVAL:
+            # Far behind (e.g. the DB was unreachable): start over instead of catching up
+            next_tick = now
+        time.sleep(max(0, next_tick - now))
+finally:
+    flush_to_database()
\ No newline at end of file
@@ -1,7 +1,7 @@
 import struct
 import serial
 import logging
-from config import get_device_config, PRECISION
+from config import DEVICE_CONFIGS, PRECISION
 
 """
 This module provides functions for Modbus RTU communication to interact with 
@@ -13,16 +13,107 @@ for both AC and DC (SOLAR) meters.
 # Modbus function code for reading holding registers
 READ_HOLDING_REGISTERS = 0x04
 
-# Pre-computed CRC-16 lookup table for efficient checksum calculation.
-CRC16_TABLE = [0x0000, 0xA001] + [0] * 254
-for i in range(1, 256):
-    crc = i
-    for _ in range(8):
-        if crc & 0x0001:
-            crc = (crc >> 1) ^ 0xA001
-        else:
-            crc >>= 1
-    CRC16_TABLE[i] = crc
+# Precompiled struct formats: CRC trailer, request body after the slave address,
+# and one register layout per register count (filled in by _registers_struct)
+CRC_STRUCT = struct.Struct('<H')
+REQUEST_STRUCT = struct.Struct('>BHH')
+_REGISTER_STRUCTS = {}
+
+def _registers_struct(num_registers):
+    register_struct = _REGISTER_STRUCTS.get(num_registers)
+    if register_struct is None:
+        register_struct = _REGISTER_STRUCTS[num_registers] = struct.Struct(f'>{num_registers}H')
+    return register_struct
+
+# Slave address byte that starts every request frame, per device
+SLAVE_ADDRESS_BYTES = {prefix: bytes([config['slave_address']]) for prefix, config in DEVICE_CONFIGS.items()}
+
+# Complete request frames (CRC included), keyed by (device_prefix, function_code,
+# register_address, num_registers). Each poll sends the same frame, so it is built once.
+_REQUEST_FRAMES = {}
+
+def _request_frame(function_code, register_address, num_registers, device_prefix):
+    key = (device_prefix, function_code, register_address, num_registers)
+    command = _REQUEST_FRAMES.get(key)
+    if command is None:
+        # Pack the command: Slave Address, Function Code, Start Address, Num Registers
+        command = SLAVE_ADDRESS_BYTES[device_prefix] + REQUEST_STRUCT.pack(function_code, register_address, num_registers)
+        command = _REQUEST_FRAMES[key] = command + calculate_crc(command)
+    return command
+
+# Pre-computed CRC-16 lookup table (poly 0xA001, reflected) for efficient checksum calculation.
+CRC16_TABLE = (
+    0x0000, 0xC0C1, 0xC181, 0x0140, 0xC301, 0x03C0, 0x0280, 0xC241,
+    0xC601, 0x06C0, 0x0780, 0xC741, 0x0500, 0xC5C1, 0xC481, 0x0440,
+    0xCC01, 0x0CC0, 0x0D80, 0xCD41, 0x0F00, 0xCFC1, 0xCE81, 0x0E40,
+    0x0A00, 0xCAC1, 0xCB81, 0x0B40, 0xC901, 0x09C0, 0x0880, 0xC841,
+    0xD801, 0x18C0, 0x1980, 0xD941, 0x1B00, 0xDBC1, 0xDA81, 0x1A40,
+    0x1E00, 0xDEC1, 0xDF81, 0x1F40, 0xDD01, 0x1DC0, 0x1C80, 0xDC41,
+    0x1400, 0xD4C1, 0xD581, 0x1540, 0xD701, 0x17C0, 0x1680, 0xD641,
+    0xD201, 0x12C0, 0x1380, 0xD341, 0x1100, 0xD1C1, 0xD081, 0x1040,
+    0xF001, 0x30C0, 0x3180, 0xF141, 0x3300, 0xF3C1, 0xF281, 0x3240,
+    0x3600, 0xF6C1, 0xF781, 0x3740, 0xF501, 0x35C0, 0x3480, 0xF441,
+    0x3C00, 0xFCC1, 0xFD81, 0x3D40, 0xFF01, 0x3FC0, 0x3E80, 0xFE41,
+    0xFA01, 0x3AC0, 0x3B80, 0xFB41, 0x3900, 0xF9C1, 0xF881, 0x3840,
+    0x2800, 0xE8C1, 0xE981, 0x2940, 0xEB01, 0x2BC0, 0x2A80, 0xEA41,
+    0xEE01, 0x2EC0, 0x2F80, 0xEF41, 0x2D00, 0xEDC1, 0xEC81, 0x2C40,
+    0xE401, 0x24C0, 0x2580, 0xE541, 0x2700, 0xE7C1, 0xE681, 0x2640,
+    0x2200, 0xE2C1, 0xE381, 0x2340, 0xE101, 0x21C0, 0x2080, 0xE041,
+    0xA001, 0x60C0, 0x6180, 0xA141, 0x6300, 0xA3C1, 0xA281, 0x6240,
+    0x6600, 0xA6C1, 0xA781, 0x6740, 0xA501, 0x65C0, 0x6480, 0xA441,
+    0x6C00, 0xACC1, 0xAD81, 0x6D40, 0xAF01, 0x6FC0, 0x6E80, 0xAE41,
+    0xAA01, 0x6AC0, 0x6B80, 0xAB41, 0x6900, 0xA9C1, 0xA881, 0x6840,
+    0x7800, 0xB8C1, 0xB981, 0x7940, 0xBB01, 0x7BC0, 0x7A80, 0xBA41,
+    0xBE01, 0x7EC0, 0x7F80, 0xBF41, 0x7D00, 0xBDC1, 0xBC81, 0x7C40,
+    0xB401, 0x74C0, 0x7580, 0xB541, 0x7700, 0xB7C1, 0xB681, 0x7640,
+    0x7200, 0xB2C1, 0xB381, 0x7340, 0xB101, 0x71C0, 0x7080, 0xB041,
+    0x5000, 0x90C1, 0x9181, 0x5140, 0x9301, 0x53C0, 0x5280, 0x9241,
+    0x9601, 0x56C0, 0x5780, 0x9741, 0x5500, 0x95C1, 0x9481, 0x5440,
+    0x9C01, 0x5CC0, 0x5D80, 0x9D41, 0x5F00, 0x9FC1, 0x9E81, 0x5E40,
+    0x5A00, 0x9AC1, 0x9B81, 0x5B40, 0x9901, 0x59C0, 0x5880, 0x9841,
+    0x8801, 0x48C0, 0x4980, 0x8941, 0x4B00, 0x8BC1, 0x8A81, 0x4A40,
+    0x4E00, 0x8EC1, 0x8F81, 0x4F40, 0x8D01, 0x4DC0, 0x4C80, 0x8C41,
+    0x4400, 0x84C1, 0x8581, 0x4540, 0x8701, 0x47C0, 0x4680, 0x8641,
+    0x8201, 0x42C0, 0x4380, 0x8341, 0x4100, 0x81C1, 0x8081, 0x4040,
+)
+
+# Slicing-by-2 companion table: the CRC update for a byte followed by a zero byte.
+# The table is linear over XOR, so two bytes fold in as CRC16_TABLE_2[lo] ^ CRC16_TABLE[hi].
+CRC16_TABLE_2 = tuple((t >> 8) ^ CRC16_TABLE[t & 0xFF] for t in CRC16_TABLE)
+
+# crcmod's C extension runs the same table without per-byte interpreter overhead;
+# it is optional and the pure Python loop below is used when it isn't installed.
+try:
+    import crcmod
+    _crc16_modbus = crcmod.mkCrcFun(0x18005, initCrc=0xFFFF, rev=True, xorOut=0x0000)
+except ImportError:
+    _crc16_modbus = None
+
+def crc16(data):
+    """
+    Computes the Modbus CRC-16 of the given data as an integer.
+
+    Running it over a whole frame including its trailing CRC gives 0 when the
+    frame is intact, so responses can be checked in a single pass.
+
+    Args:
+        data (bytes): The data for which to calculate the CRC.
+
+    Returns:
+        int: The 16-bit CRC value.
+    """
+    if _crc16_modbus is not None:
+        return _crc16_modbus(bytes(data))
+    # Two bytes per iteration (slicing-by-2), then the odd trailing byte if any
+    crc = 0xFFFF
+    it = iter(data)
+    for lo, hi in zip(it, it):
+        crc ^= lo | (hi << 8)
+        crc = CRC16_TABLE_2[crc & 0xFF] ^ CRC16_TABLE[crc >> 8]
+    if len(data) & 1:
+        crc ^= data[-1]
+        crc = (crc >> 8) ^ CRC16_TABLE[crc & 0xFF]
+    return crc
 
 def calculate_crc(data):
     """
@@ -34,11 +125,7 @@ def calculate_crc(data):
     Returns:
         bytes: A 2-byte CRC value in little-endian format.
     """
-    crc = 0xFFFF
-    for byte in data:
-        crc ^= byte
-        crc = (crc >> 8) ^ CRC16_TABLE[crc & 0xFF]
-    return struct.pack('<H', crc)
+    return CRC_STRUCT.pack(crc16(data))
 
 def send_modbus_request(ser, function_code, register_address, num_registers, device_prefix):
     """
@@ -54,11 +141,8 @@ def send_modbus_request(ser, function_code, register_address, num_registers, dev
     Returns:
         bytes: The raw data payload from the response if successful, otherwise None.
     """
-    config = get_device_config(device_prefix)
     try:
-        # Pack the command: Slave Address, Function Code, Start Address, Num Registers
-        command = struct.pack('>BBHH', config['slave_address'], function_code, register_address, num_registers)
-        command += calculate_crc(command)
+        command = _request_frame(function_code, register_address, num_registers, device_prefix)
         
         ser.write(command)
         
@@ -70,12 +154,14 @@ def send_modbus_request(ser, function_code, register_address, num_registers, dev
             logging.warning(f"[{device_prefix}] Incomplete response received")
             return None
             
-        if calculate_crc(response[:-2]) != response[-2:]:
+        # Slices of the memoryview don't copy the response
+        frame = memoryview(response)
+        if crc16(frame) != 0:
             logging.warning(f"[{device_prefix}] CRC mismatch in response")
             return None
             
         # Return only the data payload (removes slave address, func code, and byte count)
-        return response[3:-2]
+        return frame[3:-2]
     except serial.SerialException as e:
         logging.error(f"[{device_prefix}] Serial communication error: {e}")
         return None
@@ -108,11 +194,24 @@ def read_holding_registers(ser, register_address, num_registers, device_prefix):
             )
             return None
         # Unpack the raw byte data into a tuple of unsigned short integers (H)
-        return struct.unpack(f'>{num_registers}H', data)
+        return _registers_struct(num_registers).unpack(data)
     except Exception as e:
         logging.error(f"[{device_prefix}] Error reading holding registers: {e}")
         return None
 
+def _scale(raw, decimals):
+    """
+    Converts an integer register reading in units of 10**-decimals to a float.
+
+    Dividing by an exact power of ten already yields the float closest to the
+    decimal reading (2301 / 10 == 230.1, unlike 2301 * 0.1), so round() is only
+    needed when PRECISION keeps fewer digits than the register has.
+    """
+    value = raw / 10 ** decimals
+    if decimals > PRECISION:
+        return round(value, PRECISION)
+    return value
+
 def parse_pzem_data(registers, device_prefix):
     """
     Parses raw register data from PZEM energy meters into a structured dictionary.
@@ -136,12 +235,12 @@ def parse_pzem_data(registers, device_prefix):
     try:
         if device_prefix == 'AC':
             # Data mapping for AC PZEM meter
-            voltage = round(registers[0] * 0.1, PRECISION)
-            current = round((registers[2] << 16 | registers[1]) * 0.001, PRECISION) # 32-bit value
-            power = round((registers[4] << 16 | registers[3]) * 0.1, PRECISION) # 32-bit value
-            energy = round((registers[6] << 16 | registers[5]), PRECISION) # 32-bit value
-            frequency = round(registers[7] * 0.1, PRECISION)
-            power_factor = round(registers[8] * 0.01, PRECISION)
+            voltage = _scale(registers[0], 1)
+            current = _scale(registers[2] << 16 | registers[1], 3) # 32-bit value
+            power = _scale(registers[4] << 16 | registers[3], 1) # 32-bit value
+            energy = registers[6] << 16 | registers[5] # 32-bit value, Wh
+            frequency = _scale(registers[7], 1)
+            power_factor = _scale(registers[8], 2)
             
             # Basic validation for AC data
             if power_factor > 1 or frequency > 65:
@@ -159,10 +258,10 @@ def parse_pzem_data(registers, device_prefix):
 
         elif device_prefix == 'SOLAR':
             # Data mapping for DC/Solar PZEM meter
-            voltage = round(registers[0] * 0.01, PRECISION)
-            current = round(registers[1] * 0.01, PRECISION)
-            power = round((registers[3] << 16 | registers[2]) * 0.1, PRECISION) # 32-bit value
-            energy = round((registers[5] << 16 | registers[4]), PRECISION) # 32-bit value
+            voltage = _scale(registers[0], 2)
+            current = _scale(registers[1], 2)
+            power = _scale(registers[3] << 16 | registers[2], 1) # 32-bit value
+            energy = registers[5] << 16 | registers[4] # 32-bit value, Wh
             
             # Basic validation for DC data
             if power == 0 and current > 0:
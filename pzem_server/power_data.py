@@ -1,39 +1,137 @@
 import os
+import time
+import atexit
+import threading
 import serial
 import logging
-from config import get_device_config
+from concurrent.futures import ThreadPoolExecutor
+from config import DEVICE_CONFIGS
 from modbus import read_holding_registers, parse_pzem_data
 
-ac_config = get_device_config('AC')
-solar_config = get_device_config('SOLAR')
+class Sensor:
+    """
+    One PZEM meter: its device prefix (also the key in get_power_data's result),
+    its config and how many registers a poll reads.
+    """
+    __slots__ = ("name", "config", "port", "register_count")
+
+    def __init__(self, name, register_count):
+        self.name = name
+        self.config = DEVICE_CONFIGS[name]
+        self.port = self.config['serial_port']
+        self.register_count = register_count
+
+SENSORS = (
+    Sensor('AC', 9),
+    Sensor('SOLAR', 6),
+)
+
+# Sensors grouped by serial port: groups are polled in parallel, sensors sharing
+# a port one after another so their requests don't interleave on the wire
+def _group_by_port(sensors):
+    groups = {}
+    for sensor in sensors:
+        groups.setdefault(sensor.port, []).append(sensor)
+    return tuple(tuple(group) for group in groups.values())
 
-ac_port = ac_config['serial_port']
-solar_port = solar_config['serial_port']
+PORT_GROUPS = _group_by_port(SENSORS)
 
-def _read_sensor_data(port, register_count, sensor_type):
+# get_power_data results younger than this (seconds) are returned without polling again
+POWER_DATA_TTL = float(os.getenv('POWER_DATA_TTL', 0.2))
+_cache = {'time': float('-inf'), 'data': None}
+_poll_lock = threading.Lock()
+
+# Reads every port group but the first, which the calling thread reads; kept for the process lifetime
+_executor = ThreadPoolExecutor(max_workers=max(1, len(PORT_GROUPS) - 1), thread_name_prefix='pzem-poll')
+
+# Serial ports are opened once and kept open between polls, keyed by device path
+_serial_ports = {}
+
+def _get_port(config):
     """
-    Opens a serial port, reads data from a sensor, and parses it.
-    Returns parsed data or None if an error occurs.
+    Returns the open serial.Serial for a device config, opening it on first use.
+
+    timeout bounds a whole response; inter_byte_timeout ends the read as soon as
+    the line goes quiet mid-frame, so a dropped byte doesn't stall the poll for
+    the full timeout.
     """
+    port = config['serial_port']
+    ser = _serial_ports.get(port)
+    if ser is None:
+        ser = _serial_ports[port] = serial.Serial(
+            port=port,
+            baudrate=config['baud_rate'],
+            timeout=config['serial_timeout'],
+            inter_byte_timeout=config['inter_byte_timeout'],
+            exclusive=True
+        )
+    return ser
+
+def _close_port(port):
+    ser = _serial_ports.pop(port, None)
+    if ser is not None:
+        try:
+            ser.close()
+        except Exception:
+            pass
+
+@atexit.register
+def _close_ports():
+    for port in list(_serial_ports):
+        _close_port(port)
+
+def _read_sensor_data(sensor):
+    """
+    Reads data from a sensor over its (persistent) serial port, and parses it.
+    Returns parsed data or None if an error occurs; the port is then closed so
+    the next poll reopens it instead of reading leftovers of a broken frame.
+    """
+    port = sensor.port
+    sensor_type = sensor.name
     try:
-        with serial.Serial(port=port, baudrate=9600, timeout=1) as ser:
-            registers = read_holding_registers(ser, 0x0000, register_count, sensor_type)
-            if registers:
-                return parse_pzem_data(registers, sensor_type)
-            return None
+        ser = _get_port(sensor.config)
+        registers = read_holding_registers(ser, 0x0000, sensor.register_count, sensor_type)
+        if registers:
+            return parse_pzem_data(registers, sensor_type)
+        _close_port(port)
+        return None
     except serial.SerialException as e:
         logging.error(f"Could not open or read from {sensor_type} serial port ({port}): {e}")
+        _close_port(port)
         return None
     except Exception as e:
         logging.error(f"An unexpected error occurred with {sensor_type} sensor ({port}): {e}")
+        _close_port(port)
         return None
 
 def get_power_data():
     """
-    Fetches power data from both AC and Solar sensors.
+    Fetches power data from both AC and Solar sensors. Results are reused for
+    POWER_DATA_TTL seconds, and concurrent callers wait for the poll already in
+    progress instead of starting another transaction on the serial lines.
+    """
+    if time.monotonic() - _cache['time'] < POWER_DATA_TTL:
+        return _cache['data']
+    with _poll_lock:
+        # Another caller may have refreshed it while this one waited for the lock
+        if time.monotonic() - _cache['time'] < POWER_DATA_TTL:
+            return _cache['data']
+        data = _poll_sensors()
+        _cache['data'] = data
+        _cache['time'] = time.monotonic()
+        return data
+
+def _read_group(sensors):
+    return [(sensor.name, _read_sensor_data(sensor)) for sensor in sensors]
+
+def _poll_sensors():
+    """
+    Reads all sensors. Port groups are read at once, so a poll takes as long
+    as the slowest port rather than the sum of all of them.
     """
-    data = {
-        'AC': _read_sensor_data(ac_port, 9, 'AC'),
-        'SOLAR': _read_sensor_data(solar_port, 6, 'SOLAR')
-    }
+    first, *rest = PORT_GROUPS
+    futures = [_executor.submit(_read_group, group) for group in rest]
+    data = dict(_read_group(first))
+    for future in futures:
+        data.update(future.result())
     return data
\ No newline at end of file